@@ -5,8 +5,12 @@ import traceback
 from typing import Any
 
 from app.routes import auth
+from app.services import database, request_context
 from app.utils.auth import require_auth, require_admin
 
+# Download and open the database while the Lambda container initializes
+database.connect_on_cold_start()
+
 
 def make_response(status_code: int, body: Any, content_type: str = 'application/json') -> dict:
     """Create API Gateway response.
@@ -61,6 +65,8 @@ def handler(event: dict, context: Any) -> dict:
         API Gateway response
     """
     try:
+        request_context.reset()
+
         # Parse request
         http_method = event.get('requestContext', {}).get('http', {}).get('method', 'GET')
         path = event.get('rawPath', event.get('path', '/'))
@@ -80,11 +86,18 @@ def handler(event: dict, context: Any) -> dict:
         # Query parameters
         query_params = event.get('queryStringParameters', {}) or {}
 
-        # Route request
-        return route_request(http_method, path, headers, body, query_params)
+        # Route request, then upload any committed writes once
+        response = route_request(http_method, path, headers, body, query_params)
+        database.flush_db()
+        return response
 
     except Exception as e:
         traceback.print_exc()
+        try:
+            # Keep writes committed before the failure
+            database.flush_db()
+        except Exception:
+            traceback.print_exc()
         return error_response(500, 'internal_error', str(e))
 
 
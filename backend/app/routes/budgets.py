@@ -89,7 +89,7 @@ def handle_upsert(body: dict) -> dict:
         """, (year, category_id, annual_amount))
 
     # Fetch the budget entry
-    row = database.fetch_one("""
+    budget = database.fetch_one_dict("""
         SELECT b.*, c.name as category_name, c.type as category_type
         FROM budgets b
         JOIN categories c ON b.category_id = c.id
@@ -99,7 +99,7 @@ def handle_upsert(body: dict) -> dict:
     return {
         'statusCode': 200,
         'headers': {'Content-Type': 'application/json'},
-        'body': json.dumps(database.row_to_dict(row))
+        'body': json.dumps(budget)
     }
 
 
@@ -1,10 +1,10 @@
 """Dashboard routes."""
 
 import json
-from datetime import date, datetime
+from datetime import datetime
 from typing import Optional
 
-from app.services import database, budget_calc
+from app.services import database, budget_calc, request_context
 from app.routes import dues
 
 
@@ -22,9 +22,9 @@ def handle_get_dashboard(as_of_date: Optional[str] = None) -> dict:
         try:
             snapshot_date = datetime.strptime(as_of_date, '%Y-%m-%d').date()
         except ValueError:
-            snapshot_date = date.today()
+            snapshot_date = request_context.today()
     else:
-        snapshot_date = date.today()
+        snapshot_date = request_context.today()
 
     year = snapshot_date.year
 
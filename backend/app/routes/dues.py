@@ -3,52 +3,65 @@
 import json
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import Dict, List, Optional
 
-from app.services import database, budget_calc
+from app.services import database, budget_calc, request_context
 from app.services.budget_calc import CALCULATED_DUES_START_YEAR
 
 # First year with transaction data
 BASE_YEAR = 2025
 
 
-def calculate_unit_carryover(unit: dict, target_year: int) -> Decimal:
-    """Calculate cumulative unpaid balance carried forward to target_year.
+def calculate_unit_carryovers(units: List[dict], target_year: int) -> Dict[str, Decimal]:
+    """Calculate cumulative unpaid balances carried forward to target_year.
 
     For years > BASE_YEAR, this iterates through all prior years and calculates:
     carryover = (historical_debt + annual_dues - payments) accumulated over time.
+    Historical debt, budget and payments are each fetched once per year for
+    all units.
 
     Carryover can be negative (credit balance) if a unit overpays.
 
     Args:
-        unit: Unit dict with 'number' and 'ownership_pct'
+        units: Unit dicts with 'number' and 'ownership_pct'
         target_year: The year to calculate carryover for
 
     Returns:
-        Cumulative balance (positive = owes money, negative = credit)
+        Dict mapping unit number to cumulative balance (positive = owes
+        money, negative = credit)
     """
     if target_year <= BASE_YEAR:
         # For base year, use seeded historical debt only
-        return Decimal(str(database.get_unit_past_due(unit['number'], target_year) or 0))
+        past_dues = _unit_past_dues(target_year)
+        return {
+            unit['number']: Decimal(str(past_dues.get(unit['number']) or 0))
+            for unit in units
+        }
 
-    carryover = Decimal('0')
+    carryovers = {unit['number']: Decimal('0') for unit in units}
 
     for year in range(BASE_YEAR, target_year):
-        # Get historical debt for this year (typically only applies to 2025)
-        historical_debt = Decimal(str(database.get_unit_past_due(unit['number'], year) or 0))
+        # Historical debt (typically only applies to 2025), budget and payments for this year
+        past_dues = _unit_past_dues(year)
+        total_budget = Decimal(str(budget_calc.get_total_operating_budget(year)))
+        payments = database.get_unit_payments_totals([unit['number'] for unit in units], year)
 
-        # Get annual budget for this year
-        total_budget = budget_calc.get_total_operating_budget(year)
-        annual_dues = Decimal(str(total_budget)) * Decimal(str(unit['ownership_pct']))
+        for unit in units:
+            number = unit['number']
+            historical_debt = Decimal(str(past_dues.get(number) or 0))
+            annual_dues = total_budget * Decimal(str(unit['ownership_pct']))
+            paid = Decimal(str(payments[number]))
+
+            # Add to running carryover (can be negative for credits)
+            year_owed = carryovers[number] + historical_debt + annual_dues
+            carryovers[number] = year_owed - paid
 
-        # Get payments made during this year
-        paid = Decimal(str(database.get_unit_payments_total(unit['number'], year) or 0))
+    return carryovers
 
-        # Add to running carryover (can be negative for credits)
-        year_owed = carryover + historical_debt + annual_dues
-        carryover = year_owed - paid
 
-    return carryover
+def _unit_past_dues(year: int) -> Dict[str, float]:
+    """Map unit number to seeded historical debt for a year."""
+    return {pd['unit_number']: pd['past_due_balance'] for pd in database.get_unit_past_dues(year)}
 
 
 def get_dues_status(year: Optional[int] = None, as_of_date: Optional[date] = None) -> dict:
@@ -68,10 +81,9 @@ def get_dues_status(year: Optional[int] = None, as_of_date: Optional[date] = Non
     """
     if not year:
         current_year = database.get_config('current_year')
-        year = int(current_year) if current_year else date.today().year
+        year = int(current_year) if current_year else request_context.today().year
 
-    if as_of_date is None:
-        as_of_date = date.today()
+    as_of_date = as_of_date or request_context.today()
 
     # Get units
     units = database.get_units()
@@ -101,9 +113,10 @@ def get_dues_status(year: Optional[int] = None, as_of_date: Optional[date] = Non
         # NEW: Calculate dues from total operating budget
         total_operating_budget = budget_calc.get_total_operating_budget(year)
 
+        carryovers = calculate_unit_carryovers(units, year)
         for unit in units:
-            # Calculate carryover from all prior years (including credits)
-            carryover = float(calculate_unit_carryover(unit, year))
+            # Carryover from all prior years (including credits)
+            carryover = float(carryovers[unit['number']])
             # Unit's share = Total Operating Budget × Ownership %
             annual_budget = total_operating_budget * unit['ownership_pct']
             expected_total = carryover + annual_budget
@@ -134,9 +147,10 @@ def get_dues_status(year: Optional[int] = None, as_of_date: Optional[date] = Non
             unit_num = row['category'].replace('Dues ', '')
             dues_budgets[unit_num] = row['annual_amount'] or 0
 
+        carryovers = calculate_unit_carryovers(units, year)
         for unit in units:
             # For legacy years, carryover is just the seeded historical debt
-            carryover = float(calculate_unit_carryover(unit, year))
+            carryover = float(carryovers[unit['number']])
             annual_budget = dues_budgets.get(unit['number'], 0)
             expected_total = carryover + annual_budget
             total_annual_budget += expected_total
@@ -1,10 +1,9 @@
 """Report generation routes."""
 
 import base64
-from datetime import date
 from typing import Optional
 
-from app.services import pdf_generator
+from app.services import request_context
 
 
 def handle_generate_pdf(as_of_date: Optional[str] = None) -> dict:
@@ -17,10 +16,13 @@ def handle_generate_pdf(as_of_date: Optional[str] = None) -> dict:
         Response with PDF content
     """
     try:
+        # ReportLab is slow to import, so only load it when a PDF is requested
+        from app.services import pdf_generator
+
         pdf_bytes = pdf_generator.generate_dashboard_pdf(as_of_date)
 
         # Determine filename date
-        date_str = as_of_date or date.today().isoformat()
+        date_str = as_of_date or request_context.today().isoformat()
 
         # Return as base64 for API Gateway
         return {
@@ -1,10 +1,9 @@
 """Unit statement routes."""
 
 import json
-from datetime import date
 from typing import Optional
 
-from app.services import database
+from app.services import database, request_context
 
 
 # Valid unit numbers
@@ -40,10 +39,10 @@ def handle_get_statement(unit_number: str, year: Optional[int] = None) -> dict:
     # Get current year if not specified
     if not year:
         current_year_config = database.get_config('current_year')
-        year = int(current_year_config) if current_year_config else date.today().year
+        year = int(current_year_config) if current_year_config else request_context.today().year
 
     prior_year = year - 1
-    today = date.today()
+    today = request_context.today()
     current_month = today.month
 
     # Get unit info
@@ -211,7 +210,7 @@ def handle_get_payment_history(unit_number: str, year: Optional[int] = None) ->
     else:
         # Get payments for current and prior year
         current_year_config = database.get_config('current_year')
-        current_year = int(current_year_config) if current_year_config else date.today().year
+        current_year = int(current_year_config) if current_year_config else request_context.today().year
         prior_year = current_year - 1
 
         current_payments = database.get_unit_recent_payments(unit_number, current_year, limit=100)
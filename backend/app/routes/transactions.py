@@ -1,19 +1,23 @@
 """Transaction routes."""
 
 import base64
+import io
 import json
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional, Set
 
 from app.services import database, csv_processor, categorizer
 
 
-def is_duplicate(conn, post_date: str, account_number: str, description: str,
-                 debit: float, credit: float, balance: float) -> bool:
-    """Check if a transaction already exists.
+def transaction_key(post_date: str, account_number: str, description: str,
+                    debit: Optional[float], credit: Optional[float],
+                    balance: Optional[float]) -> Optional[tuple]:
+    """Build the key used to spot an already-imported transaction.
+
+    Mirrors SQL equality: NaN amounts are stored as NULL, and a row without
+    a balance never counts as a duplicate.
 
     Args:
-        conn: Database connection
         post_date: Transaction post date
         account_number: Account number
         description: Transaction description
@@ -22,18 +26,40 @@ def is_duplicate(conn, post_date: str, account_number: str, description: str,
         balance: Running balance
 
     Returns:
-        True if duplicate exists
+        Key tuple, or None if the row can't match an existing one
+    """
+    if balance is None or balance != balance:
+        return None
+    if debit != debit:
+        debit = None
+    if credit != credit:
+        credit = None
+    return (post_date, account_number, description, debit, credit, balance)
+
+
+def get_existing_transaction_keys(conn, start_date: str, end_date: str) -> Set[tuple]:
+    """Load duplicate-check keys for stored transactions in a date range.
+
+    One range query over the post_date index replaces a lookup per
+    uploaded row.
+
+    Args:
+        conn: Database connection
+        start_date: First post date to load (YYYY-MM-DD)
+        end_date: Last post date to load (YYYY-MM-DD)
+
+    Returns:
+        Set of keys as built by transaction_key()
     """
-    row = conn.execute("""
-        SELECT id FROM transactions
-        WHERE post_date = ?
-        AND account_number = ?
-        AND description = ?
-        AND (debit = ? OR (debit IS NULL AND ? IS NULL))
-        AND (credit = ? OR (credit IS NULL AND ? IS NULL))
-        AND balance = ?
-    """, (post_date, account_number, description, debit, debit, credit, credit, balance)).fetchone()
-    return row is not None
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    rows = cursor.execute("""
+        SELECT post_date, account_number, description, debit, credit, balance
+        FROM transactions
+        WHERE post_date BETWEEN ? AND ?
+        AND balance IS NOT NULL
+    """, (start_date, end_date)).fetchall()
+    return set(rows)
 
 
 def handle_list_transactions(query: dict) -> dict:
@@ -124,8 +150,7 @@ def handle_list_transactions(query: dict) -> dict:
     offset = int(query.get('offset', 0))
     sql += f" LIMIT {limit} OFFSET {offset}"
 
-    rows = database.fetch_all(sql, tuple(params))
-    transactions = database.rows_to_dicts(rows)
+    transactions = database.fetch_all_dicts(sql, tuple(params))
 
     return {
         'statusCode': 200,
@@ -158,11 +183,15 @@ def handle_upload(event_body: dict, raw_body: str = '') -> dict:
             # Direct file content
             csv_content = event_body['file']
         elif 'body' in event_body:
-            # Base64 encoded
+            # Base64 encoded; decoded to text while parsing rather than
+            # holding the whole upload as both bytes and str
             try:
-                csv_content = base64.b64decode(event_body['body']).decode('utf-8')
+                raw = base64.b64decode(event_body['body'])
             except Exception:
                 csv_content = event_body['body']
+            else:
+                if raw:
+                    csv_content = io.TextIOWrapper(io.BytesIO(raw), encoding='utf-8', newline='')
         elif raw_body:
             # Try to extract from multipart or use directly
             if 'Content-Disposition' in raw_body:
@@ -183,7 +212,11 @@ def handle_upload(event_body: dict, raw_body: str = '') -> dict:
             }
 
         # Parse CSV
-        result = csv_processor.parse_csv(csv_content)
+        try:
+            result = csv_processor.parse_csv(csv_content)
+        except UnicodeDecodeError:
+            # Decoded body wasn't UTF-8: treat the body itself as the CSV
+            result = csv_processor.parse_csv(event_body['body'])
 
         if result.errors:
             return {
@@ -216,18 +249,34 @@ def handle_upload(event_body: dict, raw_body: str = '') -> dict:
                 'needs_review': 0
             }
 
+            # Auto-categorize everything not pre-categorized in the CSV in one batch
+            pending = [
+                i for i, txn in enumerate(result.transactions)
+                if not (txn.category and txn.category in categories)
+            ]
+            auto_results = dict(zip(pending, categorizer.categorize_transactions([
+                (result.transactions[i].description, result.transactions[i].account_name)
+                for i in pending
+            ])))
+
+            # Load keys of stored rows in the file's date range once
+            existing_keys: Set[tuple] = set()
+            if not replace_all and result.transactions:
+                post_dates = [txn.post_date for txn in result.transactions]
+                existing_keys = get_existing_transaction_keys(conn, min(post_dates), max(post_dates))
+
             # Process each transaction
-            for txn in result.transactions:
+            for i, txn in enumerate(result.transactions):
                 # Check for duplicate (skip if already exists)
-                if not replace_all and is_duplicate(
-                    conn,
+                key = transaction_key(
                     txn.post_date,
                     txn.account_number,
                     txn.description,
                     txn.debit,
                     txn.credit,
                     txn.balance
-                ):
+                )
+                if not replace_all and key is not None and key in existing_keys:
                     stats['skipped'] += 1
                     continue
 
@@ -244,10 +293,7 @@ def handle_upload(event_body: dict, raw_body: str = '') -> dict:
                     stats['categorized'] += 1
                 else:
                     # Auto-categorize
-                    cat_result = categorizer.categorize_transaction(
-                        txn.description,
-                        txn.account_name
-                    )
+                    cat_result = auto_results[i]
                     auto_category_id = cat_result.category_id
                     confidence = cat_result.confidence
                     needs_review = cat_result.needs_review
@@ -281,6 +327,9 @@ def handle_upload(event_body: dict, raw_body: str = '') -> dict:
                     1 if needs_review else 0
                 ))
                 stats['added'] += 1
+                # Later rows in this file must see the ones just inserted
+                if key is not None:
+                    existing_keys.add(key)
 
             # Update last upload timestamp
             database.set_config('last_upload_at', datetime.now().isoformat())
@@ -331,8 +380,7 @@ def handle_download(query: dict) -> dict:
 
     sql += " ORDER BY t.post_date DESC, t.id DESC"
 
-    rows = database.fetch_all(sql, tuple(params))
-    transactions = database.rows_to_dicts(rows)
+    transactions = database.fetch_all_dicts(sql, tuple(params))
 
     csv_content = csv_processor.generate_csv(transactions, include_app_columns=True)
 
@@ -397,7 +445,7 @@ def handle_update(transaction_id: int, body: dict) -> dict:
             )
 
     # Fetch updated transaction
-    updated = database.fetch_one("""
+    updated = database.fetch_one_dict("""
         SELECT t.*,
                c.name as category,
                ac.name as auto_category
@@ -410,7 +458,7 @@ def handle_update(transaction_id: int, body: dict) -> dict:
     return {
         'statusCode': 200,
         'headers': {'Content-Type': 'application/json'},
-        'body': json.dumps(database.row_to_dict(updated))
+        'body': json.dumps(updated)
     }
 
 
@@ -420,7 +468,7 @@ def handle_review_queue() -> dict:
     Returns:
         Response with transactions needing review
     """
-    rows = database.fetch_all("""
+    transactions = database.fetch_all_dicts("""
         SELECT t.*,
                c.name as category,
                ac.name as auto_category
@@ -431,8 +479,6 @@ def handle_review_queue() -> dict:
         ORDER BY t.description ASC, t.post_date DESC
         LIMIT 100
     """)
-
-    transactions = database.rows_to_dicts(rows)
     count = database.fetch_one("SELECT COUNT(*) as count FROM transactions WHERE needs_review = 1")
 
     return {
@@ -1,9 +1,8 @@
 """Unit management routes."""
 
 import json
-from datetime import date
 
-from app.services import database
+from app.services import database, request_context
 
 
 def handle_get_units(query: dict) -> dict:
@@ -17,7 +16,7 @@ def handle_get_units(query: dict) -> dict:
     """
     year = query.get('year')
     if not year:
-        year = date.today().year
+        year = request_context.today().year
     else:
         try:
             year = int(year)
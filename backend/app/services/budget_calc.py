@@ -1,16 +1,34 @@
 """Budget calculation service."""
 
+import sqlite3
 from datetime import date
-from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
-from app.services import database
+from app.services import database, request_context
 
 # Cutoff year: 2025+ uses calculated dues from operating budget
 # Years before this use legacy per-unit budget entries
 CALCULATED_DUES_START_YEAR = 2025
 
 
+def _as_of_filter(year: int, as_of_date: date) -> Tuple[str, tuple]:
+    """Build the optional as_of_date clause for a single-year query.
+
+    When as_of_date falls after the requested year, the year filter already
+    bounds every row, so the extra post_date comparison is skipped.
+
+    Args:
+        year: Year being queried
+        as_of_date: Only include transactions on or before this date
+
+    Returns:
+        Tuple of (SQL fragment, query params including the year)
+    """
+    if as_of_date.year > year:
+        return '', (str(year),)
+    return 'AND t.post_date <= ?', (str(year), as_of_date.isoformat())
+
+
 def get_total_operating_budget(year: int) -> float:
     """Calculate total annual operating budget including Reserve Contribution.
 
@@ -29,48 +47,81 @@ def get_total_operating_budget(year: int) -> float:
         JOIN categories c ON b.category_id = c.id
         WHERE b.year = ? AND c.type = 'Expense' AND c.active = 1
     """
-    row = database.fetch_one(sql, (year,))
-    return row['total'] if row else 0.0
+    row = database.fetch_one_tuple(sql, (year,))
+    return row[0] if row else 0.0
 
 
-def get_ytd_actuals(year: int, as_of_date: Optional[date] = None) -> Dict[int, float]:
-    """Get YTD actual amounts by category for budget comparison.
+def _get_budget_rows(year: int, as_of_date: date,
+                     total_operating_budget: Optional[float]) -> List[tuple]:
+    """Fetch active categories with a non-zero annual budget or YTD actual.
 
-    NOTE: This ONLY includes Income and Expense categories.
-    Transfers (type='Transfer' and type='Internal') are intentionally excluded
-    because they are not income or expenses - they just move money between accounts.
-    Transfers DO affect account balances (handled by get_account_balances()),
-    but should NOT appear in income/expense budget summaries.
+    For 2025+, the Interest income budget is calculated in SQL as 0.1% of
+    the operating budget, so callers treat every row the same way.
 
     Args:
-        year: Year to calculate
+        year: Budget year
         as_of_date: Only include transactions on or before this date
+        total_operating_budget: Operating budget for calculated-dues years, else None
 
     Returns:
-        Dict mapping category_id to actual amount (Income and Expense only)
+        Tuples of (category_id, name, type, annual_amount, ytd_actual)
     """
-    if as_of_date is None:
-        as_of_date = date.today()
-
-    # Income = credits, Expenses = debits
-    # Transfers excluded - they're not income or expenses
-    # Filter by year AND on or before as_of_date
-    sql = """
-        SELECT
-            t.category_id,
-            c.type,
-            SUM(CASE WHEN c.type = 'Income' THEN t.credit ELSE t.debit END) as amount
-        FROM transactions t
-        JOIN categories c ON t.category_id = c.id
-        WHERE strftime('%Y', t.post_date) = ?
-        AND t.post_date <= ?
-        AND t.category_id IS NOT NULL
-        AND c.type IN ('Income', 'Expense')
-        GROUP BY t.category_id
+    date_filter, actual_params = _as_of_filter(year, as_of_date)
+    calculated = total_operating_budget is not None
+    interest_budget = total_operating_budget * 0.001 if calculated else 0.0
+
+    sql = f"""
+        SELECT * FROM (
+            SELECT
+                c.id,
+                c.name,
+                c.type,
+                CASE WHEN ? AND c.name = 'Interest income' THEN ?
+                     ELSE CAST(COALESCE(b.annual_amount, 0) AS REAL) END as annual_amount,
+                COALESCE(a.amount, 0) as ytd_actual
+            FROM categories c
+            LEFT JOIN budgets b ON b.category_id = c.id AND b.year = ?
+            LEFT JOIN (
+                SELECT
+                    t.category_id,
+                    SUM(CASE WHEN tc.type = 'Income' THEN t.credit ELSE t.debit END) as amount
+                FROM transactions t
+                JOIN categories tc ON t.category_id = tc.id
+                WHERE strftime('%Y', t.post_date) = ?
+                {date_filter}
+                AND tc.type IN ('Income', 'Expense')
+                GROUP BY t.category_id
+            ) a ON a.category_id = c.id
+            WHERE c.active = 1
+        )
+        -- Skip categories with zero budget AND zero actual
+        WHERE annual_amount <> 0 OR ytd_actual <> 0
+        ORDER BY type, name
     """
-    rows = database.fetch_all(sql, (str(year), as_of_date.isoformat()))
+    params = (1 if calculated else 0, interest_budget, year) + actual_params
+    return database.fetch_all_tuples(sql, params)
+
 
-    return {row['category_id']: row['amount'] or 0 for row in rows}
+def _round_categories(rows: List[tuple]) -> List[dict]:
+    """Round raw category rows to cents and shape them for the response.
+
+    Args:
+        rows: Tuples of (id, name, type, annual, ytd_actual, remaining)
+
+    Returns:
+        List of category dicts with amounts rounded to 2 decimals
+    """
+    return [
+        {
+            'id': category_id,
+            'category': category_name,
+            'type': cat_type,
+            'annual_budget': round(annual, 2),
+            'ytd_actual': round(ytd_actual, 2),
+            'remaining': round(remaining, 2)
+        }
+        for category_id, category_name, cat_type, annual, ytd_actual, remaining in rows
+    ]
 
 
 def get_budget_summary(year: int, as_of_date: Optional[date] = None) -> dict:
@@ -90,14 +141,7 @@ def get_budget_summary(year: int, as_of_date: Optional[date] = None) -> dict:
         Dict with income_summary, expense_summary, and category details.
         If no budget exists for the year, returns $0 for all budget amounts.
     """
-    if as_of_date is None:
-        as_of_date = date.today()
-
-    # Get budgets for the year (may be empty if no budget set up)
-    budgets = database.get_budgets(year)
-
-    # Get actuals through as_of_date
-    actuals = get_ytd_actuals(year, as_of_date=as_of_date)
+    as_of_date = as_of_date or request_context.today()
 
     # Process income
     income_categories = []
@@ -110,41 +154,25 @@ def get_budget_summary(year: int, as_of_date: Optional[date] = None) -> dict:
     expense_ytd_actual = 0
 
     # For 2025+, get operating budget upfront to calculate interest income
+    calculated_income = year >= CALCULATED_DUES_START_YEAR
     total_operating_budget = None
-    if year >= CALCULATED_DUES_START_YEAR:
+    if calculated_income:
         total_operating_budget = get_total_operating_budget(year)
 
-    for budget in budgets:
-        cat_type = budget['category_type']
-        annual = budget['annual_amount'] or 0
-        category_id = budget['category_id']
-        category_name = budget['category_name']
+    # Budgets and actuals for the year (budgets may be empty if no budget set up)
+    rows = _get_budget_rows(year, as_of_date, total_operating_budget)
 
-        # For 2025+, Interest budget is calculated as 0.1% of operating budget
-        if year >= CALCULATED_DUES_START_YEAR and category_name == 'Interest':
-            annual = total_operating_budget * 0.001
-
-        ytd_actual = actuals.get(category_id, 0)
+    for category_id, category_name, cat_type, annual, ytd_actual in rows:
         remaining = annual - ytd_actual
 
-        # Skip categories with zero budget AND zero actual
-        if annual == 0 and ytd_actual == 0:
-            continue
-
-        cat_data = {
-            'id': category_id,
-            'category': category_name,
-            'type': cat_type,
-            'annual_budget': round(annual, 2),
-            'ytd_actual': round(ytd_actual, 2),
-            'remaining': round(remaining, 2)
-        }
+        # Keep raw floats here; rounding happens once when building the response
+        cat_data = (category_id, category_name, cat_type, annual, ytd_actual, remaining)
 
         if cat_type == 'Income':
             income_categories.append(cat_data)
             income_ytd_actual += ytd_actual
             # For 2025+, we calculate dues from operating budget, not from category budgets
-            if year < CALCULATED_DUES_START_YEAR:
+            if not calculated_income:
                 income_annual_budget += annual
         elif cat_type == 'Expense':
             expense_categories.append(cat_data)
@@ -152,9 +180,7 @@ def get_budget_summary(year: int, as_of_date: Optional[date] = None) -> dict:
             expense_ytd_actual += ytd_actual
 
     # For 2025+, income budget equals operating budget (99.9% dues + 0.1% interest = 100%)
-    calculated_income = False
-    if year >= CALCULATED_DUES_START_YEAR:
-        calculated_income = True
+    if calculated_income:
         income_annual_budget = total_operating_budget
 
     return {
@@ -165,17 +191,49 @@ def get_budget_summary(year: int, as_of_date: Optional[date] = None) -> dict:
             'ytd_actual': round(income_ytd_actual, 2),
             'calculated': calculated_income,
             'total_operating_budget': round(total_operating_budget, 2) if total_operating_budget else None,
-            'categories': income_categories
+            'categories': _round_categories(income_categories)
         },
         'expense_summary': {
             'annual_budget': round(expense_annual_budget, 2),
             'ytd_actual': round(expense_ytd_actual, 2),
             'remaining': round(expense_annual_budget - expense_ytd_actual, 2),
-            'categories': expense_categories
+            'categories': _round_categories(expense_categories)
         }
     }
 
 
+def _latest_balances(as_of: Optional[str] = None) -> List[sqlite3.Row]:
+    """Fetch the most recent balance for each account.
+
+    Runs one LIMIT 1 lookup per account against the
+    (account_name, post_date, id) index instead of joining against a
+    MAX(post_date) subquery, so cost grows with the number of accounts
+    rather than the number of transactions.
+
+    Args:
+        as_of: Only consider transactions on or before this YYYY-MM-DD date
+
+    Returns:
+        Rows with name and balance, ordered by account name
+    """
+    date_filter = 'AND t.post_date <= ?' if as_of else ''
+    sql = f"""
+        SELECT a.account_name as name,
+               (SELECT t.balance FROM transactions t
+                WHERE t.account_name = a.account_name
+                {date_filter}
+                ORDER BY t.post_date DESC, t.id DESC
+                LIMIT 1) as balance
+        FROM (
+            SELECT DISTINCT account_name FROM transactions t
+            WHERE 1=1 {date_filter}
+        ) a
+        ORDER BY a.account_name
+    """
+    params = (as_of, as_of) if as_of else ()
+    return database.fetch_all(sql, params)
+
+
 def get_account_balances_at_year_start(year: int) -> List[dict]:
     """Get account balances at the end of prior year (Dec 31, year-1).
 
@@ -190,24 +248,7 @@ def get_account_balances_at_year_start(year: int) -> List[dict]:
     """
     prior_year_end = f"{year - 1}-12-31"
 
-    sql = """
-        SELECT t.account_name as name, t.balance
-        FROM transactions t
-        INNER JOIN (
-            SELECT account_name, MAX(post_date) as max_date
-            FROM transactions
-            WHERE post_date <= ?
-            GROUP BY account_name
-        ) latest ON t.account_name = latest.account_name
-                 AND t.post_date = latest.max_date
-        WHERE t.id = (
-            SELECT MAX(id) FROM transactions t2
-            WHERE t2.account_name = t.account_name
-            AND t2.post_date = latest.max_date
-        )
-        ORDER BY t.account_name
-    """
-    rows = database.fetch_all(sql, (prior_year_end,))
+    rows = _latest_balances(prior_year_end)
 
     # Return dict for easy lookup, include all expected accounts with 0 default
     account_names = ['Checking', 'Reserve Fund', 'Savings']
@@ -232,43 +273,10 @@ def get_account_balances(as_of_date: Optional[date] = None) -> List[dict]:
     """
     if as_of_date is None:
         # Get most recent balance for each account (no date filter)
-        sql = """
-            SELECT t.account_name as name, t.balance
-            FROM transactions t
-            INNER JOIN (
-                SELECT account_name, MAX(post_date) as max_date
-                FROM transactions
-                GROUP BY account_name
-            ) latest ON t.account_name = latest.account_name
-                     AND t.post_date = latest.max_date
-            WHERE t.id = (
-                SELECT MAX(id) FROM transactions t2
-                WHERE t2.account_name = t.account_name
-                AND t2.post_date = latest.max_date
-            )
-            ORDER BY t.account_name
-        """
-        rows = database.fetch_all(sql)
+        rows = _latest_balances()
     else:
         # Get balance as of specific date (most recent transaction on or before date)
-        sql = """
-            SELECT t.account_name as name, t.balance
-            FROM transactions t
-            INNER JOIN (
-                SELECT account_name, MAX(post_date) as max_date
-                FROM transactions
-                WHERE post_date <= ?
-                GROUP BY account_name
-            ) latest ON t.account_name = latest.account_name
-                     AND t.post_date = latest.max_date
-            WHERE t.id = (
-                SELECT MAX(id) FROM transactions t2
-                WHERE t2.account_name = t.account_name
-                AND t2.post_date = latest.max_date
-            )
-            ORDER BY t.account_name
-        """
-        rows = database.fetch_all(sql, (as_of_date.isoformat(),))
+        rows = _latest_balances(as_of_date.isoformat())
 
     balances = []
     for row in rows:
@@ -304,8 +312,7 @@ def get_reserve_fund_status(year: int, as_of_date: Optional[date] = None) -> dic
     Returns:
         Dict with budget, contributions_in, expenses_out, and net
     """
-    if as_of_date is None:
-        as_of_date = date.today()
+    as_of_date = as_of_date or request_context.today()
 
     # Get budget for Reserve Contribution category
     budget_sql = """
@@ -320,26 +327,27 @@ def get_reserve_fund_status(year: int, as_of_date: Optional[date] = None) -> dic
     annual_budget = budget_row['annual_amount'] if budget_row else 0
 
     # Get contributions IN to Reserve Fund
-    contributions_sql = """
+    date_filter, params = _as_of_filter(year, as_of_date)
+    contributions_sql = f"""
         SELECT COALESCE(SUM(t.credit), 0) as amount
         FROM transactions t
         JOIN categories c ON t.category_id = c.id
         WHERE c.name = 'Reserve Contribution'
         AND strftime('%Y', t.post_date) = ?
-        AND t.post_date <= ?
+        {date_filter}
     """
-    contrib_row = database.fetch_one(contributions_sql, (str(year), as_of_date.isoformat()))
+    contrib_row = database.fetch_one(contributions_sql, params)
     contributions = contrib_row['amount'] if contrib_row else 0
 
     # Get expenses OUT of Reserve Fund (debits from Reserve Fund account)
-    expenses_sql = """
+    expenses_sql = f"""
         SELECT COALESCE(SUM(t.debit), 0) as amount
         FROM transactions t
         WHERE t.account_name = 'Reserve Fund'
         AND strftime('%Y', t.post_date) = ?
-        AND t.post_date <= ?
+        {date_filter}
     """
-    expense_row = database.fetch_one(expenses_sql, (str(year), as_of_date.isoformat()))
+    expense_row = database.fetch_one(expenses_sql, params)
     expenses = expense_row['amount'] if expense_row else 0
 
     net = contributions - expenses
@@ -362,11 +370,11 @@ def get_monthly_cashflow(year: int, as_of_date: Optional[date] = None) -> List[d
     Returns:
         List of monthly data with income and expenses
     """
-    if as_of_date is None:
-        as_of_date = date.today()
+    as_of_date = as_of_date or request_context.today()
 
     # Get monthly totals for income and expenses
-    sql = """
+    date_filter, params = _as_of_filter(year, as_of_date)
+    sql = f"""
         SELECT
             CAST(strftime('%m', t.post_date) AS INTEGER) as month,
             SUM(CASE WHEN c.type = 'Income' THEN t.credit ELSE 0 END) as income,
@@ -374,15 +382,15 @@ def get_monthly_cashflow(year: int, as_of_date: Optional[date] = None) -> List[d
         FROM transactions t
         LEFT JOIN categories c ON t.category_id = c.id
         WHERE strftime('%Y', t.post_date) = ?
-        AND t.post_date <= ?
+        {date_filter}
         GROUP BY strftime('%m', t.post_date)
         ORDER BY month
     """
-    rows = database.fetch_all(sql, (str(year), as_of_date.isoformat()))
+    rows = database.fetch_all_tuples(sql, params)
 
     # Create a list for all 12 months, filling in zeros for missing months
     monthly_data = []
-    month_map = {row['month']: row for row in rows}
+    month_map = {row[0]: row for row in rows}
 
     # Only include months up to as_of_date
     max_month = as_of_date.month if as_of_date.year == year else 12
@@ -390,8 +398,8 @@ def get_monthly_cashflow(year: int, as_of_date: Optional[date] = None) -> List[d
     for month in range(1, max_month + 1):
         row = month_map.get(month)
         if row:
-            income = row['income'] or 0
-            expenses = row['expenses'] or 0
+            income = row[1] or 0
+            expenses = row[2] or 0
         else:
             income = 0
             expenses = 0
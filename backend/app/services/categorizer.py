@@ -1,24 +1,151 @@
 """Auto-categorization service using simple string matching."""
 
-from typing import Optional
+import logging
+import os
+import re
+from typing import Callable, List, Optional, Set, Tuple
 
 from aws_lambda_powertools import Logger
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to re2 or the stdlib matcher
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:  # google-re2 is optional; fall back to the stdlib matcher
+    re2 = None
+
 from app.services import database
 from app.models.entities import CategorizationResult
 
 
 # Initialize structured logger
-logger = Logger(service="dwcoa-categorizer")
+logger = Logger(service="dwcoa-categorizer", level=os.environ.get('LOG_LEVEL', 'INFO'))
 
 # Account numbers for transfer detection
 INTERNAL_ACCOUNT_NUMBERS = ['7145', '9242', '9226']
+_INTERNAL_ACC_RE = re.compile('|'.join(re.escape(acc) for acc in INTERNAL_ACCOUNT_NUMBERS))
+
+# Transfers category ID keyed by database data version: (version, category_id)
+_TRANSFERS_ID_CACHE: Optional[Tuple[int, Optional[int]]] = None
+
+# Uppercased patterns of all rules keyed by database data version: (version, patterns)
+_PATTERN_INDEX_CACHE: Optional[Tuple[int, Set[str]]] = None
+
+# Prepared rules keyed by database data version:
+# (version, [(pattern_upper, rule)], combined matcher or None)
+_RULES_CACHE: Optional[Tuple[int, List[Tuple[str, dict]], Optional[Callable[[str], Optional[int]]]]] = None
+
+
+def _build_matcher(compiled_rules: List[Tuple[str, dict]]) -> Optional[Callable[[str], Optional[int]]]:
+    """Combine all rule patterns into a single matcher.
+
+    Rules are literal substrings, so with pyahocorasick installed they are
+    loaded into an Aho-Corasick automaton that finds every pattern in one
+    pass. With google-re2 installed instead, the patterns go into an RE2 set
+    that also scans a description once for every rule. In both cases the
+    lowest matching rule index (highest priority) wins rather than
+    whichever pattern occurs first in the description.
+
+    Without either library no matcher is built: a stdlib regex of the
+    literals backtracks once per rule at every position, so checking each
+    pattern with the C substring search is far faster.
+
+    Args:
+        compiled_rules: Prepared (uppercased pattern, rule) pairs in priority order
+
+    Returns:
+        Function mapping an uppercased description to the matching rule
+        index (or None), or None if no matcher could be built
+    """
+    if not compiled_rules:
+        return None
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for idx, (pattern_upper, _) in enumerate(compiled_rules):
+            # Keep the highest-priority index for duplicate patterns
+            if pattern_upper not in automaton:
+                automaton.add_word(pattern_upper, idx)
+        automaton.make_automaton()
+
+        def match_automaton(desc_upper: str) -> Optional[int]:
+            return min((idx for _, idx in automaton.iter(desc_upper)), default=None)
+
+        return match_automaton
+
+    if re2 is not None:
+        rule_set = re2.Set.SearchSet(re2.Options())
+        for pattern_upper, _ in compiled_rules:
+            rule_set.Add(re.escape(pattern_upper))
+        rule_set.Compile()
+
+        def match_set(desc_upper: str) -> Optional[int]:
+            hits = rule_set.Match(desc_upper)
+            return min(hits) if hits else None
+
+        return match_set
+
+    return None
+
+
+def _get_compiled_rules() -> Tuple[List[Tuple[str, dict]], Optional[Callable[[str], Optional[int]]]]:
+    """Get active rules with their match patterns prepared once.
+
+    Patterns are uppercased and combined into a single matcher when the
+    rules are loaded rather than on every transaction. The prepared rules
+    are reused until the database version changes.
+
+    Returns:
+        Tuple of ([(uppercased pattern, rule dict)] in priority order, matcher)
+    """
+    global _RULES_CACHE
+
+    version = database.get_data_version()
+    if _RULES_CACHE is not None and _RULES_CACHE[0] == version:
+        return _RULES_CACHE[1], _RULES_CACHE[2]
+
+    compiled = [(rule['pattern'].upper(), rule) for rule in database.get_categorize_rules()]
+    matcher = _build_matcher(compiled)
+    _RULES_CACHE = (version, compiled, matcher)
+    return compiled, matcher
 
 
 def get_transfers_category_id() -> Optional[int]:
-    """Get the Transfers category ID."""
+    """Get the Transfers category ID, cached until the database version changes."""
+    global _TRANSFERS_ID_CACHE
+
+    version = database.get_data_version()
+    if _TRANSFERS_ID_CACHE is not None and _TRANSFERS_ID_CACHE[0] == version:
+        return _TRANSFERS_ID_CACHE[1]
+
     cat = database.get_category_by_name('Transfers')
-    return cat['id'] if cat else None
+    transfers_id = cat['id'] if cat else None
+    _TRANSFERS_ID_CACHE = (version, transfers_id)
+    return transfers_id
+
+
+def _get_pattern_index() -> Set[str]:
+    """Get uppercased patterns of all existing rules for duplicate checks.
+
+    Loaded with one query and reused until the database version changes
+    or a new rule is learned, so checking several descriptions that are
+    already covered doesn't query per pattern.
+
+    Returns:
+        Set of uppercased rule patterns
+    """
+    global _PATTERN_INDEX_CACHE
+
+    version = database.get_data_version()
+    if _PATTERN_INDEX_CACHE is not None and _PATTERN_INDEX_CACHE[0] == version:
+        return _PATTERN_INDEX_CACHE[1]
+
+    patterns = {pattern.upper() for pattern in database.get_rule_patterns()}
+    _PATTERN_INDEX_CACHE = (version, patterns)
+    return patterns
 
 
 def categorize_transaction(description: str, account_name: str) -> CategorizationResult:
@@ -31,23 +158,106 @@ def categorize_transaction(description: str, account_name: str) -> Categorizatio
     Returns:
         CategorizationResult with category and confidence
     """
-    desc_upper = description.upper()
+    return categorize_transactions([(description, account_name)])[0]
+
+
+def categorize_transactions(items: List[Tuple[str, str]]) -> List[CategorizationResult]:
+    """Categorize a batch of transactions.
 
+    Rules and the Transfers category are looked up once for the whole
+    batch rather than once per transaction, and each distinct description
+    is matched against the rules only once (bank exports repeat the same
+    description for recurring payments).
+
+    Args:
+        items: List of (description, account_name) tuples
+
+    Returns:
+        CategorizationResult for each item, in the same order
+    """
+    compiled_rules, matcher = _get_compiled_rules()
+    transfers_id = get_transfers_category_id()
+
+    uppered = [(description, description.upper(), account_name) for description, account_name in items]
+    matches = {
+        desc_upper: _match_rule(desc_upper, compiled_rules, matcher)
+        for desc_upper in {desc_upper for _, desc_upper, _ in uppered}
+    }
+
+    debug = logger.isEnabledFor(logging.DEBUG)
+    results = [
+        _categorize_with_rules(description, desc_upper, account_name, matches[desc_upper],
+                               transfers_id, debug)
+        for description, desc_upper, account_name in uppered
+    ]
+
+    # Per-row matches are only logged at DEBUG; summarize the batch instead
+    needs_review = sum(1 for result in results if result.needs_review)
+    logger.info(
+        "Categorization batch complete",
+        extra={
+            "transaction_count": len(results),
+            "categorized": len(results) - needs_review,
+            "needs_review": needs_review
+        }
+    )
+    return results
+
+
+def _match_rule(desc_upper: str, compiled_rules: List[Tuple[str, dict]],
+                matcher: Optional[Callable[[str], Optional[int]]]) -> Optional[dict]:
+    """Find the highest-priority rule whose pattern occurs in the description.
+
+    Args:
+        desc_upper: Uppercased transaction description
+        compiled_rules: Prepared rules from _get_compiled_rules()
+        matcher: Combined matcher from _get_compiled_rules(), or None to
+            check each pattern with a substring search
+
+    Returns:
+        Matching rule dict, or None
+    """
+    if matcher is not None:
+        idx = matcher(desc_upper)
+        return compiled_rules[idx][1] if idx is not None else None
+
+    for pattern_upper, rule in compiled_rules:
+        if pattern_upper in desc_upper:
+            return rule
+    return None
+
+
+def _categorize_with_rules(description: str, desc_upper: str, account_name: str,
+                           rule: Optional[dict],
+                           transfers_id: Optional[int], debug: bool = False) -> CategorizationResult:
+    """Categorize one transaction given its already-matched rule.
+
+    Args:
+        description: Transaction description
+        desc_upper: Uppercased description
+        account_name: Account name (Savings, Checking, Reserve Fund)
+        rule: Highest-priority matching rule from _match_rule(), or None
+        transfers_id: Transfers category ID, or None if it doesn't exist
+        debug: Whether to log the per-transaction outcome
+
+    Returns:
+        CategorizationResult with category and confidence
+    """
     # Check for internal transfers first
     # Pattern: description contains 'Transfer' AND any internal account number
     if 'TRANSFER' in desc_upper:
-        if any(acc in description for acc in INTERNAL_ACCOUNT_NUMBERS):
-            transfers_id = get_transfers_category_id()
+        if _INTERNAL_ACC_RE.search(description) is not None:
             if transfers_id:
-                logger.info(
-                    "Transfer auto-detected",
-                    extra={
-                        "categorization_source": "transfer_detection",
-                        "category_id": transfers_id,
-                        "description_preview": description[:50],
-                        "account": account_name
-                    }
-                )
+                if debug:
+                    logger.debug(
+                        "Transfer auto-detected",
+                        extra={
+                            "categorization_source": "transfer_detection",
+                            "category_id": transfers_id,
+                            "description_preview": description[:50],
+                            "account": account_name
+                        }
+                    )
                 return CategorizationResult(
                     category_id=transfers_id,
                     category_name='Transfers',
@@ -57,12 +267,9 @@ def categorize_transaction(description: str, account_name: str) -> Categorizatio
                 )
 
     # Check rules (case-insensitive substring match)
-    rules = database.get_categorize_rules()
-
-    for rule in rules:
-        pattern_upper = rule['pattern'].upper()
-        if pattern_upper in desc_upper:
-            logger.info(
+    if rule:
+        if debug:
+            logger.debug(
                 "Rule match",
                 extra={
                     "categorization_source": "rule",
@@ -73,23 +280,24 @@ def categorize_transaction(description: str, account_name: str) -> Categorizatio
                     "account": account_name
                 }
             )
-            return CategorizationResult(
-                category_id=rule['category_id'],
-                category_name=rule['category_name'],
-                confidence=100,
-                needs_review=False,
-                source='rule'
-            )
+        return CategorizationResult(
+            category_id=rule['category_id'],
+            category_name=rule['category_name'],
+            confidence=100,
+            needs_review=False,
+            source='rule'
+        )
 
     # No match - flag for review
-    logger.debug(
-        "No rule match",
-        extra={
-            "categorization_source": "none",
-            "description_preview": description[:50],
-            "account": account_name
-        }
-    )
+    if debug:
+        logger.debug(
+            "No rule match",
+            extra={
+                "categorization_source": "none",
+                "description_preview": description[:50],
+                "account": account_name
+            }
+        )
     return CategorizationResult(
         category_id=None,
         category_name=None,
@@ -109,6 +317,8 @@ def learn_pattern(description: str, category_id: int) -> None:
         description: Transaction description (used as pattern)
         category_id: Category ID assigned
     """
+    global _PATTERN_INDEX_CACHE
+
     # Use the full description as the pattern (simple substring matching)
     # The admin can edit this in the Rules UI to make it more specific
     pattern = description.strip()
@@ -127,8 +337,9 @@ def learn_pattern(description: str, category_id: int) -> None:
     cat = database.get_category_by_id(category_id)
     cat_name = cat['name'] if cat else f'ID:{category_id}'
 
-    # Check if pattern already exists
-    if database.rule_pattern_exists(pattern):
+    # Check if pattern already exists (case-insensitive)
+    pattern_index = _get_pattern_index()
+    if pattern.upper() in pattern_index:
         logger.info(
             "Pattern learning skipped - pattern exists",
             extra={
@@ -139,8 +350,10 @@ def learn_pattern(description: str, category_id: int) -> None:
         )
         return
 
-    # Create new rule
+    # Create new rule; the index is rebuilt on the next learn, since a
+    # surrounding transaction may still roll this rule back
     database.create_rule(pattern, category_id)
+    _PATTERN_INDEX_CACHE = None
     logger.info(
         "Pattern learned",
         extra={
@@ -1,11 +1,14 @@
 """CSV processing for bank transaction imports."""
 
 import csv
+import hashlib
 import io
+import re
+import struct
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
-from typing import List, Optional, Tuple
+from typing import IO, List, Optional, Tuple, Union
 
 from app.services import database
 
@@ -23,9 +26,9 @@ EXPECTED_COLUMNS = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedTransaction:
-    """A parsed transaction from CSV."""
+    """A parsed transaction from CSV (slotted: one instance per CSV row)."""
     account_number: str
     account_name: str
     post_date: str  # YYYY-MM-DD format
@@ -47,11 +50,12 @@ class ParseResult:
     duplicate_count: int
 
 
-def parse_csv(content: str) -> ParseResult:
+def parse_csv(content: Union[str, IO[str]]) -> ParseResult:
     """Parse bank CSV content into transactions.
 
     Args:
-        content: CSV file content as string
+        content: CSV file content as a string, or a text stream to read
+            rows from without holding a second copy of the file
 
     Returns:
         ParseResult with transactions and any errors/warnings
@@ -59,26 +63,50 @@ def parse_csv(content: str) -> ParseResult:
     transactions: List[ParsedTransaction] = []
     errors: List[str] = []
     warnings: List[str] = []
-    seen_transactions: set = set()  # For duplicate detection
+    seen_transactions: set = set()  # Hashes of row keys, for duplicate detection
     duplicate_count = 0
 
     # Parse CSV
-    reader = csv.DictReader(io.StringIO(content))
+    stream = io.StringIO(content) if isinstance(content, str) else content
+    reader = csv.reader(stream)
+    header = next(reader, None)
 
     # Validate columns
-    if reader.fieldnames:
-        missing = set(EXPECTED_COLUMNS) - set(reader.fieldnames)
-        if missing:
-            errors.append(f"Missing required columns: {', '.join(missing)}")
-            return ParseResult([], errors, warnings, 0)
+    if not header:
+        return ParseResult([], errors, warnings, 0)
+
+    missing = set(EXPECTED_COLUMNS) - set(header)
+    if missing:
+        errors.append(f"Missing required columns: {', '.join(missing)}")
+        return ParseResult([], errors, warnings, 0)
+
+    # Column positions, looked up once instead of building a dict per row
+    idx = {name: i for i, name in enumerate(header)}
+    width = len(header)
+    account_col = idx['Account Number']
+    date_col = idx['Post Date']
+    check_col = idx['Check']
+    description_col = idx['Description']
+    debit_col = idx['Debit']
+    credit_col = idx['Credit']
+    status_col = idx['Status']
+    balance_col = idx['Balance']
+    category_col = idx.get('Category')
+
+    date_fmt: Optional[str] = None
 
     # Get account mappings
     account_map = {a['masked_number']: a['name'] for a in database.get_accounts()}
 
-    for row_num, row in enumerate(reader, start=2):  # Start at 2 (1 is header)
+    rows = (row for row in reader if row)  # Skip blank lines
+    for row_num, row in enumerate(rows, start=2):  # Start at 2 (1 is header)
         try:
+            # Treat missing trailing fields as empty
+            if len(row) < width:
+                row.extend([''] * (width - len(row)))
+
             # Parse account
-            account_number = row.get('Account Number', '').strip()
+            account_number = row[account_col].strip()
             account_name = account_map.get(account_number)
 
             if not account_name:
@@ -86,42 +114,53 @@ def parse_csv(content: str) -> ParseResult:
                 account_name = 'Unknown'
 
             # Parse date (handle various formats)
-            date_str = row.get('Post Date', '').strip()
-            post_date = parse_date(date_str)
+            # Bank exports use one date format per file: reuse the last
+            # format that matched and only probe all formats on a miss
+            date_str = row[date_col].strip()
+            post_date = None
+            if date_fmt and date_str:
+                try:
+                    post_date = _parse_date_with_format(date_str, date_fmt)
+                except ValueError:
+                    pass
+            if post_date is None and date_str:
+                post_date, fmt = _probe_date(date_str)
+                if fmt and fmt not in _NON_STICKY_DATE_FORMATS:
+                    date_fmt = fmt
             if not post_date:
                 errors.append(f"Row {row_num}: Invalid date '{date_str}'")
                 continue
 
             # Parse amounts
-            debit = parse_amount(row.get('Debit', ''))
-            credit = parse_amount(row.get('Credit', ''))
-            balance = parse_amount(row.get('Balance', ''))
+            debit = parse_amount(row[debit_col])
+            credit = parse_amount(row[credit_col])
+            balance = parse_amount(row[balance_col])
 
             if balance is None:
                 errors.append(f"Row {row_num}: Invalid balance")
                 continue
 
-            description = row.get('Description', '').strip()
+            description = row[description_col].strip()
 
             # Check for duplicates (same date + amount + description)
-            txn_key = (post_date, debit or 0, credit or 0, description)
+            txn_key = _row_fingerprint(post_date, debit, credit, description)
             if txn_key in seen_transactions:
                 duplicate_count += 1
                 warnings.append(f"Row {row_num}: Potential duplicate transaction")
             seen_transactions.add(txn_key)
 
             # Check for pre-existing category (if column exists)
-            category = row.get('Category', '').strip() or None
+            category = (row[category_col].strip() or None) if category_col is not None else None
 
             transactions.append(ParsedTransaction(
                 account_number=account_number,
                 account_name=account_name,
                 post_date=post_date,
-                check_number=row.get('Check', '').strip() or None,
+                check_number=row[check_col].strip() or None,
                 description=description,
                 debit=debit,
                 credit=credit,
-                status=row.get('Status', 'Posted').strip(),
+                status=row[status_col].strip(),
                 balance=balance,
                 category=category
             ))
@@ -132,6 +171,100 @@ def parse_csv(content: str) -> ParseResult:
     return ParseResult(transactions, errors, warnings, duplicate_count)
 
 
+# Supported date formats, in the order they are tried
+DATE_FORMATS = [
+    '%m/%d/%Y',  # 1/2/2026
+    '%m/%d/%y',  # 1/2/26
+    '%Y-%m-%d',  # 2026-01-02
+    '%d/%m/%Y',  # 2/1/2026 (European)
+    '%Y/%m/%d',  # 2026/01/02
+]
+
+# European dates are only a fallback for rows that aren't valid US dates,
+# so that format is never reused for later rows
+_NON_STICKY_DATE_FORMATS = {'%d/%m/%Y'}
+
+_US_DATE_RE = re.compile(r'([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})')
+_ISO_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+# Characters stripped from amount strings before conversion
+_AMOUNT_TABLE = str.maketrans('', '', '$,')
+
+# Packs (debit, credit) for duplicate fingerprints
+_AMOUNT_PAIR = struct.Struct('<dd')
+
+
+def _parse_date_with_format(date_str: str, fmt: str) -> str:
+    """Parse a date string with one known format.
+
+    The common US bank format is parsed with a regex and zero-padded ISO
+    dates with date.fromisoformat instead of strptime. Anything the fast
+    paths don't accept (including non-ASCII digits) still goes through
+    strptime.
+
+    Args:
+        date_str: Date string
+        fmt: strptime format from DATE_FORMATS
+
+    Returns:
+        Date in YYYY-MM-DD format
+
+    Raises:
+        ValueError: If the string doesn't match the format
+    """
+    if fmt == '%m/%d/%Y':
+        match = _US_DATE_RE.fullmatch(date_str)
+        if match:
+            try:
+                return date(int(match[3]), int(match[1]), int(match[2])).isoformat()
+            except ValueError:
+                pass  # Let strptime decide, as before
+    if fmt == '%Y-%m-%d' and _ISO_DATE_RE.fullmatch(date_str):
+        try:
+            return date.fromisoformat(date_str).isoformat()
+        except ValueError:
+            pass  # Let strptime decide, as before
+    return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
+
+
+def _probe_date(date_str: str) -> Tuple[Optional[str], Optional[str]]:
+    """Parse a date string by trying each supported format in order.
+
+    Args:
+        date_str: Date string in various formats
+
+    Returns:
+        Tuple of (date in YYYY-MM-DD format, matching format), or (None, None)
+    """
+    for fmt in DATE_FORMATS:
+        try:
+            return _parse_date_with_format(date_str, fmt), fmt
+        except ValueError:
+            continue
+
+    return None, None
+
+
+def _row_fingerprint(post_date: str, debit: Optional[float], credit: Optional[float],
+                     description: str) -> int:
+    """Compute a 64-bit fingerprint of a row's duplicate-detection key.
+
+    Args:
+        post_date: Date in YYYY-MM-DD format
+        debit: Debit amount (None treated as 0)
+        credit: Credit amount (None treated as 0)
+        description: Transaction description
+
+    Returns:
+        BLAKE2b digest of (date, debit, credit, description) as an int
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(post_date.encode())
+    digest.update(_AMOUNT_PAIR.pack(debit or 0.0, credit or 0.0))
+    digest.update(description.encode())
+    return int.from_bytes(digest.digest(), 'little')
+
+
 def parse_date(date_str: str) -> Optional[str]:
     """Parse date string to YYYY-MM-DD format.
 
@@ -144,23 +277,7 @@ def parse_date(date_str: str) -> Optional[str]:
     if not date_str:
         return None
 
-    # Try various formats
-    formats = [
-        '%m/%d/%Y',  # 1/2/2026
-        '%m/%d/%y',  # 1/2/26
-        '%Y-%m-%d',  # 2026-01-02
-        '%d/%m/%Y',  # 2/1/2026 (European)
-        '%Y/%m/%d',  # 2026/01/02
-    ]
-
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(date_str, fmt)
-            return dt.strftime('%Y-%m-%d')
-        except ValueError:
-            continue
-
-    return None
+    return _probe_date(date_str)[0]
 
 
 def parse_amount(amount_str: str) -> Optional[float]:
@@ -175,14 +292,10 @@ def parse_amount(amount_str: str) -> Optional[float]:
     if not amount_str:
         return None
 
-    # Remove currency symbols and commas
-    cleaned = amount_str.strip().replace('$', '').replace(',', '')
-
-    if not cleaned:
-        return None
-
+    # Remove currency symbols and commas in one pass; float() ignores
+    # surrounding whitespace and rejects an empty string
     try:
-        return float(cleaned)
+        return float(amount_str.translate(_AMOUNT_TABLE))
     except ValueError:
         return None
 
@@ -204,29 +317,33 @@ def generate_csv(transactions: List[dict], include_app_columns: bool = True) ->
     if include_app_columns:
         columns.extend(['Account', 'Category', 'Auto_Category', 'Confidence', 'Needs_Review'])
 
-    writer = csv.DictWriter(output, fieldnames=columns)
-    writer.writeheader()
-
-    for txn in transactions:
-        row = {
-            'Account Number': txn.get('account_number', ''),
-            'Post Date': format_date_for_csv(txn.get('post_date', '')),
-            'Check': txn.get('check_number', ''),
-            'Description': txn.get('description', ''),
-            'Debit': format_amount_for_csv(txn.get('debit')),
-            'Credit': format_amount_for_csv(txn.get('credit')),
-            'Status': txn.get('status', 'Posted'),
-            'Balance': format_amount_for_csv(txn.get('balance')),
-        }
-
-        if include_app_columns:
-            row['Account'] = txn.get('account_name', '')
-            row['Category'] = txn.get('category', '')
-            row['Auto_Category'] = txn.get('auto_category', '')
-            row['Confidence'] = txn.get('confidence', '')
-            row['Needs_Review'] = 'true' if txn.get('needs_review') else ''
-
-        writer.writerow(row)
+    writer = csv.writer(output)
+    writer.writerow(columns)
+
+    def base_row(txn: dict) -> tuple:
+        return (
+            txn.get('account_number', ''),
+            format_date_for_csv(txn.get('post_date', '')),
+            txn.get('check_number', ''),
+            txn.get('description', ''),
+            format_amount_for_csv(txn.get('debit')),
+            format_amount_for_csv(txn.get('credit')),
+            txn.get('status', 'Posted'),
+            format_amount_for_csv(txn.get('balance')),
+        )
+
+    def app_row(txn: dict) -> tuple:
+        return base_row(txn) + (
+            txn.get('account_name', ''),
+            txn.get('category', ''),
+            txn.get('auto_category', ''),
+            txn.get('confidence', ''),
+            'true' if txn.get('needs_review') else '',
+        )
+
+    # Rows are built positionally in column order
+    build_row = app_row if include_app_columns else base_row
+    writer.writerows(build_row(txn) for txn in transactions)
 
     return output.getvalue()
 
@@ -235,7 +352,15 @@ def format_date_for_csv(date_val) -> str:
     """Format date for CSV output."""
     if not date_val:
         return ''
-    if hasattr(date_val, 'strftime'):
+    if isinstance(date_val, str):
+        # Stored dates are YYYY-MM-DD; reorder the parts without strptime
+        if _ISO_DATE_RE.fullmatch(date_val):
+            try:
+                date.fromisoformat(date_val)
+            except ValueError:
+                return date_val
+            return f"{date_val[5:7]}/{date_val[8:10]}/{date_val[:4]}"
+    elif hasattr(date_val, 'strftime'):
         return date_val.strftime('%m/%d/%Y')
     # Assume string in YYYY-MM-DD format
     try:
@@ -249,4 +374,6 @@ def format_amount_for_csv(amount) -> str:
     """Format amount for CSV output."""
     if amount is None:
         return ''
+    if type(amount) is float:
+        return f"{amount:.2f}"
     return f"{float(amount):.2f}"
@@ -2,16 +2,44 @@
 
 import os
 import sqlite3
+import traceback
 from contextlib import contextmanager
+from datetime import date
 from pathlib import Path
-from typing import Any, Generator, List, Optional
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; store the database uncompressed
+    zstandard = None
 
 from app.utils import s3
 
 # Database file locations
 DB_KEY = 'dwcoa.db'
+# zstd-compressed copy, read in preference to DB_KEY when zstandard is installed
+DB_KEY_ZST = 'dwcoa.db.zst'
+# Uploads also refresh the uncompressed DB_KEY until this date, so a rollback
+# to a release that only reads DB_KEY doesn't lose writes. After it, DB_KEY
+# is no longer written and can be deleted from the bucket.
+LEGACY_DB_UPLOAD_UNTIL = date(2026, 12, 31)
 _db_connection: Optional[sqlite3.Connection] = None
 _db_path: Optional[str] = None
+# Bumped on every committed write so in-process caches can detect changes
+_data_version = 0
+# Bump whenever run_migrations() gains a step so existing databases rerun it
+SCHEMA_VERSION = 1
+# Prepared statements kept per connection (sqlite3 defaults to 128); the
+# filter and pagination variants built by routes add many distinct queries
+_STATEMENT_CACHE_SIZE = 256
+# Set when a committed write hasn't been uploaded to S3 yet
+_db_dirty = False
+# Nesting depth of transaction() blocks; only the outermost one commits
+_transaction_depth = 0
+# Reference-table lookups keyed by (name, args) -> (data version, rows)
+_LOOKUP_CACHE: Dict[tuple, Tuple[int, List[dict]]] = {}
+# app_config as a {key: value} map, keyed by data version: (version, values)
+_CONFIG_CACHE: Optional[Tuple[int, Dict[str, str]]] = None
 
 
 def get_sql_path(filename: str) -> str:
@@ -28,23 +56,36 @@ def init_db(conn: sqlite3.Connection) -> None:
         conn: SQLite connection
     """
     # Run schema
-    with open(get_sql_path('schema.sql'), 'r') as f:
-        conn.executescript(f.read())
+    _run_sql_files(conn, 'schema.sql')
 
     # Run migrations for existing databases
     run_migrations(conn)
 
-    # Run seed data
-    with open(get_sql_path('seed.sql'), 'r') as f:
-        conn.executescript(f.read())
-
-    # Run categorization rules
-    with open(get_sql_path('rules.sql'), 'r') as f:
-        conn.executescript(f.read())
+    # Run seed data and categorization rules
+    _run_sql_files(conn, 'seed.sql', 'rules.sql')
 
+    # Mark the schema current so migrate_if_needed() skips it on later starts
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     conn.commit()
 
 
+def _run_sql_files(conn: sqlite3.Connection, *filenames: str) -> None:
+    """Run SQL files as a single transaction.
+
+    executescript otherwise autocommits each statement, paying a commit
+    per INSERT block during a cold init.
+
+    Args:
+        conn: SQLite connection
+        filenames: SQL file names in the sql directory, run in order
+    """
+    scripts = []
+    for filename in filenames:
+        with open(get_sql_path(filename), 'r') as f:
+            scripts.append(f.read())
+    conn.executescript('BEGIN;\n' + '\n'.join(scripts) + '\nCOMMIT;')
+
+
 def run_migrations(conn: sqlite3.Connection) -> None:
     """Run database migrations for schema updates.
 
@@ -80,13 +121,188 @@ def run_migrations(conn: sqlite3.Connection) -> None:
         )
     """)
 
+    # Index for latest-balance-per-account lookups
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_transactions_account_latest
+        ON transactions(account_name, post_date DESC, id DESC)
+    """)
+
+    # Index for per-category date range lookups (unit statements)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_transactions_category_date
+        ON transactions(category_id, post_date)
+    """)
+
+    # Index for case-insensitive rule pattern lookups
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_rules_pattern_nocase
+        ON categorize_rules(pattern COLLATE NOCASE)
+    """)
+
+    # Data fixes only touch rows that still need them, so up-to-date pages
+    # aren't rewritten
+
     # Change Reserve Contribution from Transfer to Expense (for calculated dues)
-    conn.execute("UPDATE categories SET type = 'Expense' WHERE name = 'Reserve Contribution'")
+    conn.execute("""
+        UPDATE categories SET type = 'Expense'
+        WHERE name = 'Reserve Contribution' AND type <> 'Expense'
+    """)
 
     # Update ownership percentages (99.9% total; 0.1% is calculated interest income)
-    conn.execute("UPDATE units SET ownership_pct = 0.117 WHERE number IN ('101', '201', '301')")
-    conn.execute("UPDATE units SET ownership_pct = 0.104 WHERE number IN ('102', '202', '302')")
-    conn.execute("UPDATE units SET ownership_pct = 0.112 WHERE number IN ('103', '203', '303')")
+    conn.execute("""
+        UPDATE units SET ownership_pct = 0.117
+        WHERE number IN ('101', '201', '301') AND ownership_pct <> 0.117
+    """)
+    conn.execute("""
+        UPDATE units SET ownership_pct = 0.104
+        WHERE number IN ('102', '202', '302') AND ownership_pct <> 0.104
+    """)
+    conn.execute("""
+        UPDATE units SET ownership_pct = 0.112
+        WHERE number IN ('103', '203', '303') AND ownership_pct <> 0.112
+    """)
+
+
+def migrate_if_needed(conn: sqlite3.Connection) -> None:
+    """Run migrations unless the database is already at SCHEMA_VERSION.
+
+    The applied version is stamped in PRAGMA user_version, so warm-started
+    copies of an up-to-date database skip the migration statements.
+
+    Args:
+        conn: SQLite connection
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+
+    run_migrations(conn)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def _configure(conn: sqlite3.Connection) -> None:
+    """Apply connection PRAGMAs tuned for a local, S3-backed database file.
+
+    Args:
+        conn: SQLite connection
+    """
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-65536;
+        PRAGMA mmap_size=268435456;
+    """)
+
+
+def _read_etag(db_path: str) -> Optional[str]:
+    """Read the S3 ETag recorded for the local database copy, if any."""
+    try:
+        with open(db_path + '.etag', 'r') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_etag(db_path: str, etag: str) -> None:
+    """Record the S3 ETag the local database copy was downloaded at."""
+    with open(db_path + '.etag', 'w') as f:
+        f.write(etag)
+
+
+def _clear_etag(db_path: str) -> None:
+    """Forget the recorded ETag once the local copy has diverged from S3."""
+    try:
+        os.remove(db_path + '.etag')
+    except OSError:
+        pass
+
+
+def _find_remote_db() -> Tuple[str, Optional[str]]:
+    """Find which S3 key holds the database.
+
+    The compressed copy wins; the uncompressed key is only read when no
+    compressed copy has been written yet.
+
+    Returns:
+        Tuple of (S3 key, ETag), with ETag None if no database exists
+
+    Raises:
+        RuntimeError: If only a compressed copy exists and zstandard is missing
+    """
+    etag = s3.get_etag(DB_KEY_ZST)
+    if etag is not None:
+        if zstandard is None:
+            raise RuntimeError(f'{DB_KEY_ZST} requires the zstandard package')
+        return DB_KEY_ZST, etag
+    return DB_KEY, s3.get_etag(DB_KEY)
+
+
+def _remove_wal_files(db_path: str) -> None:
+    """Delete the WAL and shared-memory files left next to a database file.
+
+    They belong to the copy that is about to be replaced; SQLite would
+    otherwise replay the old WAL frames onto the newly downloaded file.
+    """
+    for suffix in ('-wal', '-shm'):
+        try:
+            os.remove(db_path + suffix)
+        except OSError:
+            pass
+
+
+def _download_db(key: str, db_path: str) -> None:
+    """Download the database from S3, decompressing it if needed.
+
+    The file is written to a temporary path and renamed over db_path, so
+    an interrupted download never leaves a partial database in place.
+
+    Args:
+        key: S3 key from _find_remote_db()
+        db_path: Local database path to write
+    """
+    download_path = db_path + '.download'
+    try:
+        if key != DB_KEY_ZST:
+            s3.download_file(key, download_path)
+        else:
+            compressed_path = db_path + '.zst'
+            s3.download_file(key, compressed_path)
+            try:
+                with open(compressed_path, 'rb') as src, open(download_path, 'wb') as dst:
+                    zstandard.ZstdDecompressor().copy_stream(src, dst)
+            finally:
+                os.remove(compressed_path)
+        _remove_wal_files(db_path)
+        os.replace(download_path, db_path)
+    finally:
+        if os.path.exists(download_path):
+            os.remove(download_path)
+
+
+def _upload_db(snapshot_path: str) -> None:
+    """Upload a database snapshot to S3, compressed when zstandard is available.
+
+    Until LEGACY_DB_UPLOAD_UNTIL the uncompressed copy is refreshed too,
+    after the compressed one that readers use.
+
+    Args:
+        snapshot_path: Local path of the snapshot to upload
+    """
+    if zstandard is None:
+        s3.upload_file(snapshot_path, DB_KEY)
+        return
+
+    compressed_path = snapshot_path + '.zst'
+    try:
+        with open(snapshot_path, 'rb') as src, open(compressed_path, 'wb') as dst:
+            zstandard.ZstdCompressor(level=3).copy_stream(src, dst)
+        s3.upload_file(compressed_path, DB_KEY_ZST)
+    finally:
+        if os.path.exists(compressed_path):
+            os.remove(compressed_path)
+
+    if date.today() <= LEGACY_DB_UPLOAD_UNTIL:
+        s3.upload_file(snapshot_path, DB_KEY)
 
 
 def get_connection() -> sqlite3.Connection:
@@ -102,20 +318,31 @@ def get_connection() -> sqlite3.Connection:
 
     # Download database from S3 or create new
     _db_path = s3.get_temp_path('dwcoa.db')
-
-    if s3.file_exists(DB_KEY):
-        s3.download_file(DB_KEY, _db_path)
-        _db_connection = sqlite3.connect(_db_path)
+    key, etag = _find_remote_db()
+
+    if etag is not None:
+        # Reuse a local copy left in /tmp if S3 still holds the same version.
+        # A leftover WAL means the process died with local-only writes, so
+        # the copy no longer matches the ETag.
+        if (_read_etag(_db_path) != etag or not os.path.exists(_db_path)
+                or os.path.exists(_db_path + '-wal')):
+            # The sidecar is only written once the new file is in place
+            _clear_etag(_db_path)
+            _download_db(key, _db_path)
+            _write_etag(_db_path, etag)
+        _db_connection = sqlite3.connect(_db_path, cached_statements=_STATEMENT_CACHE_SIZE)
+        _configure(_db_connection)
         _db_connection.row_factory = sqlite3.Row
         # Run migrations on existing database
-        run_migrations(_db_connection)
+        migrate_if_needed(_db_connection)
         _db_connection.commit()
         # Don't save here - only save when actual user data changes
         # This prevents race conditions where concurrent Lambda instances
         # overwrite each other's changes with stale data
     else:
         # Create new database
-        _db_connection = sqlite3.connect(_db_path)
+        _db_connection = sqlite3.connect(_db_path, cached_statements=_STATEMENT_CACHE_SIZE)
+        _configure(_db_connection)
         _db_connection.row_factory = sqlite3.Row
         init_db(_db_connection)
         # Upload initial database
@@ -124,23 +351,100 @@ def get_connection() -> sqlite3.Connection:
     return _db_connection
 
 
+def connect_on_cold_start() -> bool:
+    """Open the database during Lambda initialization.
+
+    Called at import time of the handler module, so the S3 download and
+    migrations happen in the init phase instead of the first request.
+    Outside Lambda, or if the download fails, the connection is left to be
+    opened lazily by get_connection().
+
+    Returns:
+        True if the connection was opened
+    """
+    if not os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
+        return False
+
+    try:
+        get_connection()
+    except Exception:
+        traceback.print_exc()
+        return False
+    return True
+
+
 def save_db() -> None:
     """Save database to S3."""
     global _db_connection, _db_path
 
     if _db_connection is not None and _db_path is not None:
         _db_connection.commit()
-        s3.upload_file(_db_path, DB_KEY)
+        # Upload a consistent snapshot (including WAL contents) taken with
+        # the online backup API rather than the live database file
+        snapshot_path = _db_path + '.snap'
+        snapshot = sqlite3.connect(snapshot_path)
+        try:
+            _db_connection.backup(snapshot)
+        finally:
+            snapshot.close()
+        try:
+            _upload_db(snapshot_path)
+        finally:
+            os.remove(snapshot_path)
+
+
+def flush_db() -> None:
+    """Upload the database to S3 if any writes were committed since the last upload.
+
+    Called once at the end of each request so that several writes in one
+    request cost a single upload.
+    """
+    global _db_dirty
+
+    if _db_dirty:
+        save_db()
+        _db_dirty = False
 
 
 def close_db() -> None:
     """Close database connection."""
-    global _db_connection, _db_path
+    global _db_connection, _db_path, _data_version
 
     if _db_connection is not None:
+        flush_db()
         _db_connection.close()
         _db_connection = None
         _db_path = None
+        _data_version += 1
+
+
+def get_data_version() -> int:
+    """Get the in-process data version.
+
+    The version changes whenever a write is committed through transaction()
+    or the connection is closed, so callers can key caches on it.
+
+    Returns:
+        Current data version
+    """
+    return _data_version
+
+
+def _cached_lookup(key: tuple, loader: Callable[[], List[dict]]) -> List[dict]:
+    """Return rows for a reference-data lookup, reusing them until data changes.
+
+    Args:
+        key: Cache key identifying the lookup and its arguments
+        loader: Function that queries the rows
+
+    Returns:
+        Fresh list of row dicts, safe for the caller to modify
+    """
+    cached = _LOOKUP_CACHE.get(key)
+    if cached is None or cached[0] != _data_version:
+        cached = (_data_version, loader())
+        _LOOKUP_CACHE[key] = cached
+    return [dict(row) for row in cached[1]]
 
 
 @contextmanager
@@ -150,16 +454,39 @@ def transaction() -> Generator[sqlite3.Connection, None, None]:
     Yields:
         SQLite connection
 
-    Commits on success, rolls back on exception, saves to S3.
+    Commits on success and rolls back on exception, invalidating anything
+    cached during the block. Nested blocks join the outermost one. The upload to S3 is deferred to flush_db(), and a block
+    that changed no rows doesn't mark the database dirty at all.
     """
+    global _data_version, _db_dirty, _transaction_depth
+
     conn = get_connection()
+    if _transaction_depth:
+        _transaction_depth += 1
+        try:
+            yield conn
+        finally:
+            _transaction_depth -= 1
+        return
+
+    _transaction_depth = 1
+    changes_before = conn.total_changes
     try:
         yield conn
         conn.commit()
-        save_db()
+        if conn.total_changes != changes_before:
+            _data_version += 1
+            if not _db_dirty and _db_path is not None:
+                _clear_etag(_db_path)
+            _db_dirty = True
     except Exception:
         conn.rollback()
+        # Lookups cached inside the block may hold rows that were just
+        # rolled back
+        _data_version += 1
         raise
+    finally:
+        _transaction_depth = 0
 
 
 def execute(sql: str, params: tuple = ()) -> sqlite3.Cursor:
@@ -215,30 +542,78 @@ def fetch_all(sql: str, params: tuple = ()) -> List[sqlite3.Row]:
     return cursor.fetchall()
 
 
-def row_to_dict(row: Optional[sqlite3.Row]) -> Optional[dict]:
-    """Convert a Row to a dict.
+def fetch_one_tuple(sql: str, params: tuple = ()) -> Optional[tuple]:
+    """Fetch a single row as a plain tuple.
+
+    Skips the Row factory for numeric lookups where columns are read by
+    position.
 
     Args:
-        row: SQLite Row object
+        sql: SQL query
+        params: Query parameters
 
     Returns:
-        Dict or None
+        Tuple or None
     """
-    if row is None:
-        return None
-    return dict(row)
+    cursor = get_connection().cursor()
+    cursor.row_factory = None
+    return cursor.execute(sql, params).fetchone()
+
+
+def fetch_all_tuples(sql: str, params: tuple = ()) -> List[tuple]:
+    """Fetch all rows as plain tuples.
+
+    Skips the Row factory for hot aggregation loops where columns are
+    read by position.
+
+    Args:
+        sql: SQL query
+        params: Query parameters
+
+    Returns:
+        List of tuples
+    """
+    cursor = get_connection().cursor()
+    cursor.row_factory = None
+    return cursor.execute(sql, params).fetchall()
+
+
+def fetch_all_dicts(sql: str, params: tuple = ()) -> List[dict]:
+    """Fetch all rows as dicts.
+
+    Zips plain tuples with the column names, which is cheaper than
+    building a Row per result and then converting it with dict().
+
+    Args:
+        sql: SQL query
+        params: Query parameters
+
+    Returns:
+        List of row dicts
+    """
+    cursor = get_connection().cursor()
+    cursor.row_factory = None
+    rows = cursor.execute(sql, params).fetchall()
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row)) for row in rows]
 
 
-def rows_to_dicts(rows: List[sqlite3.Row]) -> List[dict]:
-    """Convert Rows to list of dicts.
+def fetch_one_dict(sql: str, params: tuple = ()) -> Optional[dict]:
+    """Fetch a single row as a dict.
 
     Args:
-        rows: List of SQLite Row objects
+        sql: SQL query
+        params: Query parameters
 
     Returns:
-        List of dicts
+        Row dict or None
     """
-    return [dict(row) for row in rows]
+    cursor = get_connection().cursor()
+    cursor.row_factory = None
+    row = cursor.execute(sql, params).fetchone()
+    if row is None:
+        return None
+    return dict(zip([col[0] for col in cursor.description], row))
 
 
 # Convenience functions for common queries
@@ -253,33 +628,39 @@ def get_categories(active_only: bool = True, category_type: Optional[str] = None
     Returns:
         List of category dicts
     """
-    sql = "SELECT * FROM categories WHERE 1=1"
-    params: List[Any] = []
+    def load() -> List[dict]:
+        sql = "SELECT * FROM categories WHERE 1=1"
+        params: List[Any] = []
+
+        if active_only:
+            sql += " AND active = 1"
 
-    if active_only:
-        sql += " AND active = 1"
+        if category_type:
+            sql += " AND type = ?"
+            params.append(category_type)
 
-    if category_type:
-        sql += " AND type = ?"
-        params.append(category_type)
+        sql += " ORDER BY type, name"
+        return fetch_all_dicts(sql, tuple(params))
 
-    sql += " ORDER BY type, name"
-    return rows_to_dicts(fetch_all(sql, tuple(params)))
+    return _cached_lookup(('categories', active_only, category_type), load)
 
 
 def get_category_by_id(category_id: int) -> Optional[dict]:
     """Get a category by ID."""
-    return row_to_dict(fetch_one("SELECT * FROM categories WHERE id = ?", (category_id,)))
+    return fetch_one_dict("SELECT * FROM categories WHERE id = ?", (category_id,))
 
 
 def get_category_by_name(name: str) -> Optional[dict]:
     """Get a category by name."""
-    return row_to_dict(fetch_one("SELECT * FROM categories WHERE name = ?", (name,)))
+    return fetch_one_dict("SELECT * FROM categories WHERE name = ?", (name,))
 
 
 def get_accounts() -> List[dict]:
     """Get all account mappings."""
-    return rows_to_dicts(fetch_all("SELECT * FROM accounts ORDER BY name"))
+    return _cached_lookup(
+        ('accounts',),
+        lambda: fetch_all_dicts("SELECT * FROM accounts ORDER BY name")
+    )
 
 
 def get_account_name(masked_number: str) -> Optional[str]:
@@ -290,7 +671,10 @@ def get_account_name(masked_number: str) -> Optional[str]:
 
 def get_units() -> List[dict]:
     """Get all units with ownership percentages."""
-    return rows_to_dicts(fetch_all("SELECT * FROM units ORDER BY number"))
+    return _cached_lookup(
+        ('units',),
+        lambda: fetch_all_dicts("SELECT * FROM units ORDER BY number")
+    )
 
 
 def get_budgets(year: int) -> List[dict]:
@@ -298,13 +682,15 @@ def get_budgets(year: int) -> List[dict]:
 
     Returns ALL active categories, not just ones with existing budgets.
     Categories without a budget entry will show annual_amount=0.
+    annual_amount is always a float so budget math never mixes in other
+    numeric types.
     """
     sql = """
         SELECT
             c.id as category_id,
             c.name as category_name,
             c.type as category_type,
-            COALESCE(b.annual_amount, 0) as annual_amount,
+            CAST(COALESCE(b.annual_amount, 0) AS REAL) as annual_amount,
             b.id as budget_id,
             ? as year
         FROM categories c
@@ -312,21 +698,28 @@ def get_budgets(year: int) -> List[dict]:
         WHERE c.active = 1
         ORDER BY c.type, c.name
     """
-    return rows_to_dicts(fetch_all(sql, (year, year)))
+    return fetch_all_dicts(sql, (year, year))
 
 
 def get_config(key: str) -> Optional[str]:
-    """Get a config value."""
-    row = fetch_one("SELECT value FROM app_config WHERE key = ?", (key,))
-    return row['value'] if row else None
+    """Get a config value, cached until the data version changes."""
+    global _CONFIG_CACHE
+
+    if _CONFIG_CACHE is None or _CONFIG_CACHE[0] != _data_version:
+        _CONFIG_CACHE = (_data_version, dict(fetch_all_tuples("SELECT key, value FROM app_config")))
+    return _CONFIG_CACHE[1].get(key)
 
 
 def set_config(key: str, value: str) -> None:
     """Set a config value."""
+    global _CONFIG_CACHE
+
     execute(
         "INSERT OR REPLACE INTO app_config (key, value, updated_at) VALUES (?, ?, datetime('now'))",
         (key, value)
     )
+    # Visible to get_config() before the surrounding transaction commits
+    _CONFIG_CACHE = None
 
 
 def get_categorize_rules() -> List[dict]:
@@ -338,7 +731,7 @@ def get_categorize_rules() -> List[dict]:
         WHERE r.active = 1
         ORDER BY r.priority DESC, r.id
     """
-    return rows_to_dicts(fetch_all(sql))
+    return _cached_lookup(('categorize_rules',), lambda: fetch_all_dicts(sql))
 
 
 def get_rules() -> List[dict]:
@@ -349,7 +742,7 @@ def get_rules() -> List[dict]:
         JOIN categories c ON r.category_id = c.id
         ORDER BY c.name, r.pattern
     """
-    return rows_to_dicts(fetch_all(sql))
+    return _cached_lookup(('rules',), lambda: fetch_all_dicts(sql))
 
 
 def get_rule_by_id(rule_id: int) -> Optional[dict]:
@@ -360,7 +753,7 @@ def get_rule_by_id(rule_id: int) -> Optional[dict]:
         JOIN categories c ON r.category_id = c.id
         WHERE r.id = ?
     """
-    return row_to_dict(fetch_one(sql, (rule_id,)))
+    return fetch_one_dict(sql, (rule_id,))
 
 
 def rule_pattern_exists(pattern: str, exclude_id: Optional[int] = None) -> bool:
@@ -373,7 +766,7 @@ def rule_pattern_exists(pattern: str, exclude_id: Optional[int] = None) -> bool:
     Returns:
         True if pattern exists
     """
-    sql = "SELECT id FROM categorize_rules WHERE UPPER(pattern) = UPPER(?)"
+    sql = "SELECT id FROM categorize_rules WHERE pattern = ? COLLATE NOCASE"
     params: List[Any] = [pattern]
 
     if exclude_id:
@@ -383,6 +776,19 @@ def rule_pattern_exists(pattern: str, exclude_id: Optional[int] = None) -> bool:
     return fetch_one(sql, tuple(params)) is not None
 
 
+def get_rule_patterns() -> List[str]:
+    """Get the patterns of all rules, active or not.
+
+    Returns:
+        List of pattern strings
+    """
+    return [row[0] for row in fetch_all_tuples("SELECT pattern FROM categorize_rules")]
+
+
+# Same columns as get_rule_by_id(), returned straight from INSERT/UPDATE
+_RULE_RETURNING = "*, (SELECT name FROM categories WHERE id = category_id) AS category_name"
+
+
 def create_rule(pattern: str, category_id: int) -> dict:
     """Create a new categorization rule.
 
@@ -394,16 +800,14 @@ def create_rule(pattern: str, category_id: int) -> dict:
         Created rule dict
     """
     with transaction():
-        execute(
-            """INSERT INTO categorize_rules (pattern, category_id, confidence, priority, active)
-               VALUES (?, ?, 100, 100, 1)""",
+        row = execute(
+            f"""INSERT INTO categorize_rules (pattern, category_id, confidence, priority, active)
+               VALUES (?, ?, 100, 100, 1)
+               RETURNING {_RULE_RETURNING}""",
             (pattern, category_id)
-        )
-        # Get the created rule
-        cursor = execute("SELECT last_insert_rowid()")
-        rule_id = cursor.fetchone()[0]
+        ).fetchone()
 
-    return get_rule_by_id(rule_id)
+    return dict(row) if row is not None else None
 
 
 def update_rule(rule_id: int, pattern: Optional[str] = None,
@@ -440,9 +844,12 @@ def update_rule(rule_id: int, pattern: Optional[str] = None,
     params.append(rule_id)
 
     with transaction():
-        execute(f"UPDATE categorize_rules SET {', '.join(updates)} WHERE id = ?", tuple(params))
+        row = execute(
+            f"UPDATE categorize_rules SET {', '.join(updates)} WHERE id = ? RETURNING {_RULE_RETURNING}",
+            tuple(params)
+        ).fetchone()
 
-    return get_rule_by_id(rule_id)
+    return dict(row) if row is not None else None
 
 
 def delete_rule(rule_id: int) -> bool:
@@ -458,14 +865,10 @@ def delete_rule(rule_id: int) -> bool:
     Returns:
         True if rule was deleted, False if not found
     """
-    rule = get_rule_by_id(rule_id)
-    if not rule:
-        return False
-
     with transaction():
-        execute("DELETE FROM categorize_rules WHERE id = ?", (rule_id,))
+        deleted = execute("DELETE FROM categorize_rules WHERE id = ?", (rule_id,)).rowcount
 
-    return True
+    return deleted > 0
 
 
 def get_unit(unit_number: str) -> Optional[dict]:
@@ -477,8 +880,7 @@ def get_unit(unit_number: str) -> Optional[dict]:
     Returns:
         Unit dict or None if not found
     """
-    row = fetch_one("SELECT * FROM units WHERE number = ?", (unit_number,))
-    return row_to_dict(row) if row else None
+    return fetch_one_dict("SELECT * FROM units WHERE number = ?", (unit_number,))
 
 
 def update_unit(unit_number: str, past_due_balance: float) -> Optional[dict]:
@@ -521,7 +923,7 @@ def get_unit_past_dues(year: int) -> List[dict]:
         LEFT JOIN unit_past_dues upd ON u.number = upd.unit_number AND upd.year = ?
         ORDER BY u.number
     """
-    return rows_to_dicts(fetch_all(sql, (year,)))
+    return fetch_all_dicts(sql, (year,))
 
 
 def get_unit_past_due(unit_number: str, year: int) -> float:
@@ -552,24 +954,38 @@ def update_unit_past_due(unit_number: str, year: int, past_due_balance: float) -
     Returns:
         Dict with unit_number, year, past_due_balance or None if unit not found
     """
-    # Verify unit exists
-    unit = get_unit(unit_number)
-    if not unit:
-        return None
+    updated = bulk_update_unit_past_dues(year, [(unit_number, past_due_balance)])
+    return updated[0] if updated else None
+
+
+def bulk_update_unit_past_dues(year: int, items: List[Tuple[str, float]]) -> List[dict]:
+    """Update past due balances for several units in one transaction.
+
+    Args:
+        year: Budget year
+        items: List of (unit_number, past_due_balance) tuples
+
+    Returns:
+        List of dicts with unit_number, year, past_due_balance for the
+        units that exist; unknown unit numbers are skipped
+    """
+    known = {row[0] for row in fetch_all_tuples("SELECT number FROM units")}
+    items = [(unit_number, balance) for unit_number, balance in items if unit_number in known]
+    if not items:
+        return []
 
     with transaction():
-        execute(
+        execute_many(
             """INSERT INTO unit_past_dues (unit_number, year, past_due_balance)
                VALUES (?, ?, ?)
-               ON CONFLICT(unit_number, year) DO UPDATE SET past_due_balance = ?""",
-            (unit_number, year, past_due_balance, past_due_balance)
+               ON CONFLICT(unit_number, year) DO UPDATE SET past_due_balance = excluded.past_due_balance""",
+            [(unit_number, year, balance) for unit_number, balance in items]
         )
 
-    return {
-        'unit_number': unit_number,
-        'year': year,
-        'past_due_balance': past_due_balance
-    }
+    return [
+        {'unit_number': unit_number, 'year': year, 'past_due_balance': balance}
+        for unit_number, balance in items
+    ]
 
 
 def is_budget_locked(year: int) -> bool:
@@ -594,8 +1010,8 @@ def get_budget_lock(year: int) -> Optional[dict]:
     Returns:
         Dict with year, locked, locked_at or None if not set
     """
-    row = fetch_one("SELECT * FROM budget_locks WHERE year = ?", (year,))
-    return row_to_dict(row) if row else {'year': year, 'locked': False, 'locked_at': None}
+    lock = fetch_one_dict("SELECT * FROM budget_locks WHERE year = ?", (year,))
+    return lock if lock is not None else {'year': year, 'locked': False, 'locked_at': None}
 
 
 def set_budget_lock(year: int, locked: bool) -> dict:
@@ -645,6 +1061,21 @@ def get_total_operating_budget_annual(year: int) -> float:
     return row['total'] if row and row['total'] else 0.0
 
 
+def _year_range(year: int) -> Tuple[str, str]:
+    """Get [start, end) post_date bounds for a year.
+
+    Comparing post_date against a range instead of strftime('%Y', ...)
+    lets SQLite use the post_date indexes.
+
+    Args:
+        year: Calendar year
+
+    Returns:
+        Tuple of (first day of year, first day of next year) as ISO strings
+    """
+    return f'{year:04d}-01-01', f'{year + 1:04d}-01-01'
+
+
 def get_unit_payments_total(unit_number: str, year: int) -> float:
     """Get total dues payments for a unit in a specific year.
 
@@ -655,16 +1086,37 @@ def get_unit_payments_total(unit_number: str, year: int) -> float:
     Returns:
         Total payments amount
     """
-    sql = """
-        SELECT SUM(t.credit) as total
+    return get_unit_payments_totals([unit_number], year)[unit_number]
+
+
+def get_unit_payments_totals(unit_numbers: List[str], year: int) -> Dict[str, float]:
+    """Get total dues payments for several units in a specific year.
+
+    Args:
+        unit_numbers: Unit numbers (e.g., ['101', '102'])
+        year: Payment year
+
+    Returns:
+        Dict mapping each unit number to its total payments (0.0 if none)
+    """
+    if not unit_numbers:
+        return {}
+
+    placeholders = ', '.join('?' * len(unit_numbers))
+    sql = f"""
+        SELECT c.name, SUM(t.credit)
         FROM transactions t
         JOIN categories c ON t.category_id = c.id
-        WHERE c.name = ?
-        AND strftime('%Y', t.post_date) = ?
+        WHERE c.name IN ({placeholders})
+        AND t.post_date >= ? AND t.post_date < ?
+        GROUP BY c.name
     """
-    category_name = f'Dues {unit_number}'
-    row = fetch_one(sql, (category_name, str(year)))
-    return row['total'] if row and row['total'] else 0.0
+    category_names = [f'Dues {unit_number}' for unit_number in unit_numbers]
+    totals = dict(fetch_all_tuples(sql, (*category_names, *_year_range(year))))
+    return {
+        unit_number: totals.get(name) or 0.0
+        for unit_number, name in zip(unit_numbers, category_names)
+    }
 
 
 def get_unit_recent_payments(unit_number: str, year: int, limit: int = 10) -> List[dict]:
@@ -683,12 +1135,12 @@ def get_unit_recent_payments(unit_number: str, year: int, limit: int = 10) -> Li
         FROM transactions t
         JOIN categories c ON t.category_id = c.id
         WHERE c.name = ?
-        AND strftime('%Y', t.post_date) = ?
+        AND t.post_date >= ? AND t.post_date < ?
         AND t.credit IS NOT NULL
         AND t.credit > 0
-        ORDER BY t.post_date DESC
+        ORDER BY t.post_date DESC, t.id DESC
         LIMIT ?
     """
     category_name = f'Dues {unit_number}'
-    rows = fetch_all(sql, (category_name, str(year), limit))
+    rows = fetch_all(sql, (category_name, *_year_range(year), limit))
     return [{'date': row['date'], 'amount': row['amount'], 'description': row['description']} for row in rows]
@@ -1,8 +1,9 @@
 """PDF report generation using ReportLab."""
 
 import io
+import re
 from datetime import date, datetime
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
@@ -10,9 +11,85 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 
-from app.services import database, budget_calc
+from app.services import database, budget_calc, request_context
 from app.routes import dues
 
+# Zero-padded dates go through the C parser; anything else keeps strptime's rules
+_ISO_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+# Rendered reports keyed on (snapshot date, data version). Entries for an
+# older version are dropped, so this only holds reports for current data.
+_PDF_CACHE: Dict[Tuple[str, int], bytes] = {}
+_PDF_CACHE_SIZE = 8
+
+# Bound once so table cells skip re-parsing the template on every call
+_CURRENCY_FORMAT = '${:,.2f}'.format
+
+# Styles are immutable once built, so share them across reports
+_STYLES = getSampleStyleSheet()
+_TITLE_STYLE = ParagraphStyle(
+    'Title',
+    parent=_STYLES['Heading1'],
+    fontSize=16,
+    spaceAfter=6
+)
+_HEADING_STYLE = ParagraphStyle(
+    'Heading',
+    parent=_STYLES['Heading2'],
+    fontSize=12,
+    spaceBefore=12,
+    spaceAfter=6
+)
+_NORMAL_STYLE = _STYLES['Normal']
+_NOTE_STYLE = ParagraphStyle('Note', parent=_NORMAL_STYLE, fontSize=8, textColor=colors.grey, fontName='Helvetica-Oblique')
+_FOOTER_STYLE = ParagraphStyle('Footer', parent=_NORMAL_STYLE, fontSize=8, textColor=colors.grey)
+
+# Page margins and column widths for each table
+_PAGE_MARGINS = {
+    'topMargin': 0.5*inch,
+    'bottomMargin': 0.5*inch,
+    'leftMargin': 0.75*inch,
+    'rightMargin': 0.75*inch,
+}
+_ACCOUNT_COL_WIDTHS = (1.5*inch, 1.25*inch, 1.25*inch, 1.25*inch)
+_TITLED_SUMMARY_COL_WIDTHS = (1.2*inch, 1.3*inch)
+_SUMMARY_PAIR_COL_WIDTHS = (2.5*inch, 0.5*inch, 2.5*inch)
+_SUMMARY_GAP_WIDTH = 0.5*inch
+_SUMMARY_COL_WIDTHS = (1.5*inch, 1.5*inch)
+_DUES_COL_WIDTHS = (0.7*inch, 0.65*inch, 0.85*inch, 1*inch, 1*inch, 1*inch)
+_EXPENSE_COL_WIDTHS = (2.5*inch, 1.15*inch, 1.15*inch, 1.15*inch)
+
+# Gridded tables: grey header row, right-aligned amounts, bold totals row
+_GRID_TABLE_CMDS = [
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+]
+_ACCOUNT_TABLE_STYLE = TableStyle(_GRID_TABLE_CMDS + [
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+])
+_TOTALS_TABLE_STYLE = TableStyle(_GRID_TABLE_CMDS + [
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
+    ('LINEABOVE', (0, -1), (-1, -1), 1.5, colors.black),  # Thicker line above totals
+])
+
+# Label/amount summary boxes
+_SUMMARY_CMDS = [
+    ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+    ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+    ('TOPPADDING', (0, 0), (-1, -1), 2),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+]
+_SUMMARY_STYLE = TableStyle(_SUMMARY_CMDS)
+_TITLED_SUMMARY_STYLE = TableStyle(_SUMMARY_CMDS + [
+    ('SPAN', (0, 0), (1, 0)),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+])
+
 
 def generate_dashboard_pdf(as_of_date: Optional[str] = None) -> bytes:
     """Generate a PDF report matching the dashboard layout.
@@ -26,12 +103,44 @@ def generate_dashboard_pdf(as_of_date: Optional[str] = None) -> bytes:
     # Parse date or default to today
     if as_of_date:
         try:
-            snapshot_date = datetime.strptime(as_of_date, '%Y-%m-%d').date()
+            if _ISO_DATE_RE.fullmatch(as_of_date):
+                snapshot_date = date.fromisoformat(as_of_date)
+            else:
+                snapshot_date = datetime.strptime(as_of_date, '%Y-%m-%d').date()
         except ValueError:
-            snapshot_date = date.today()
+            snapshot_date = request_context.today()
     else:
-        snapshot_date = date.today()
+        snapshot_date = request_context.today()
+
+    # Reports only change when data is committed, so reuse a rendered copy
+    version = database.get_data_version()
+    key = (snapshot_date.isoformat(), version)
+    cached = _PDF_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    pdf_bytes = _build_dashboard_pdf(snapshot_date)
+
+    # Skip caching if a write was committed while the report was built
+    if database.get_data_version() == version:
+        for stale in [k for k in _PDF_CACHE if k[1] != version]:
+            del _PDF_CACHE[stale]
+        if len(_PDF_CACHE) >= _PDF_CACHE_SIZE:
+            del _PDF_CACHE[next(iter(_PDF_CACHE))]
+        _PDF_CACHE[key] = pdf_bytes
+
+    return pdf_bytes
+
+
+def _build_dashboard_pdf(snapshot_date: date) -> bytes:
+    """Render the dashboard PDF for a snapshot date.
 
+    Args:
+        snapshot_date: Date the report is as of
+
+    Returns:
+        PDF content as bytes
+    """
     year = snapshot_date.year
 
     # Get data as of the snapshot date
@@ -47,7 +156,6 @@ def generate_dashboard_pdf(as_of_date: Optional[str] = None) -> bytes:
 
     budget_summary = budget_calc.get_budget_summary(year, as_of_date=snapshot_date)
     dues_data = dues.get_dues_status(year, as_of_date=snapshot_date)
-    reserve_fund = budget_calc.get_reserve_fund_status(year, as_of_date=snapshot_date)
     last_updated = database.get_config('last_upload_at')
 
     # Create PDF
@@ -55,28 +163,8 @@ def generate_dashboard_pdf(as_of_date: Optional[str] = None) -> bytes:
     doc = SimpleDocTemplate(
         buffer,
         pagesize=letter,
-        topMargin=0.5*inch,
-        bottomMargin=0.5*inch,
-        leftMargin=0.75*inch,
-        rightMargin=0.75*inch
-    )
-
-    # Styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'Title',
-        parent=styles['Heading1'],
-        fontSize=16,
-        spaceAfter=6
+        **_PAGE_MARGINS
     )
-    heading_style = ParagraphStyle(
-        'Heading',
-        parent=styles['Heading2'],
-        fontSize=12,
-        spaceBefore=12,
-        spaceAfter=6
-    )
-    normal_style = styles['Normal']
 
     elements = []
 
@@ -84,59 +172,49 @@ def generate_dashboard_pdf(as_of_date: Optional[str] = None) -> bytes:
     date_display = snapshot_date.strftime('%B %d, %Y')
 
     # Title
-    elements.append(Paragraph("DWCOA Financial Dashboard", title_style))
-    elements.append(Paragraph(f"As of: {date_display}", normal_style))
+    elements.append(Paragraph("DWCOA Financial Dashboard", _TITLE_STYLE))
+    elements.append(Paragraph(f"As of: {date_display}", _NORMAL_STYLE))
     if last_updated:
-        elements.append(Paragraph(f"Last Updated: {last_updated}", normal_style))
+        elements.append(Paragraph(f"Last Updated: {last_updated}", _NORMAL_STYLE))
     elements.append(Spacer(1, 12))
 
     # Account Balances - match dashboard with Starting, Current, Change columns
-    elements.append(Paragraph("Account Balances", heading_style))
+    elements.append(Paragraph("Account Balances", _HEADING_STYLE))
 
-    # Find account data by name
-    def find_account(name):
-        return next((a for a in accounts if a['name'] == name), None)
+    # Index account data by name (names are distinct per balance query)
+    accounts_by_name = {a['name']: a for a in accounts}
 
     account_order = ['Checking', 'Savings', 'Reserve Fund']
     account_data = [['Account', 'Starting', 'Current', 'Change']]
 
     for name in account_order:
-        acc = find_account(name)
+        acc = accounts_by_name.get(name)
         starting = acc['starting_balance'] if acc else 0
         current = acc['balance'] if acc else 0
         change = current - starting
-        change_prefix = '+' if change >= 0 else ''
         account_data.append([
             name,
             format_currency(starting),
             format_currency(current),
-            f'{change_prefix}{format_currency(change)}'
+            format_signed_currency(change)
         ])
 
     # Total row
     total_change = total_cash - total_starting
-    total_change_prefix = '+' if total_change >= 0 else ''
     account_data.append([
         'Total Cash',
         format_currency(total_starting),
         format_currency(total_cash),
-        f'{total_change_prefix}{format_currency(total_change)}'
+        format_signed_currency(total_change)
     ])
 
-    account_table = Table(account_data, colWidths=[1.5*inch, 1.25*inch, 1.25*inch, 1.25*inch])
-    account_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-    ]))
+    account_table = Table(account_data, colWidths=_ACCOUNT_COL_WIDTHS)
+    account_table.setStyle(_ACCOUNT_TABLE_STYLE)
     elements.append(account_table)
     elements.append(Spacer(1, 6))
 
     # Reserve Fund Goal and Net Income summary boxes (side by side using a nested table)
+    income = budget_summary['income_summary']
     expense = budget_summary['expense_summary']
 
     # Find Reserve Fund goal from expense categories
@@ -148,68 +226,50 @@ def generate_dashboard_pdf(as_of_date: Optional[str] = None) -> bytes:
     reserve_goal = reserve_category['annual_budget'] if reserve_category else 0
 
     # Calculate Reserve Fund actual change (current - starting)
-    reserve_acc = find_account('Reserve Fund')
+    reserve_acc = accounts_by_name.get('Reserve Fund')
     reserve_starting = reserve_acc['starting_balance'] if reserve_acc else 0
     reserve_current = reserve_acc['balance'] if reserve_acc else 0
     reserve_actual_change = reserve_current - reserve_starting
     reserve_difference = reserve_actual_change - reserve_goal
 
-    reserve_change_prefix = '+' if reserve_actual_change >= 0 else ''
-    reserve_diff_prefix = '+' if reserve_difference >= 0 else ''
-
     # Net Income calculations
-    income_actual = budget_summary['income_summary']['ytd_actual']
+    income_actual = income['ytd_actual']
     expense_actual = expense['ytd_actual']
     net_income = income_actual - expense_actual
-    net_prefix = '+' if net_income >= 0 else ''
 
     # Reserve Fund Goal summary
     reserve_summary_data = [
-        [Paragraph('<b>Reserve Fund Goal</b>', normal_style), ''],
+        ['Reserve Fund Goal', ''],
         ['Goal:', format_currency(reserve_goal)],
-        ['Actual:', f'{reserve_change_prefix}{format_currency(reserve_actual_change)}'],
-        ['Difference:', f'{reserve_diff_prefix}{format_currency(reserve_difference)}']
+        ['Actual:', format_signed_currency(reserve_actual_change)],
+        ['Difference:', format_signed_currency(reserve_difference)]
     ]
-    reserve_summary_table = Table(reserve_summary_data, colWidths=[1.2*inch, 1.3*inch])
-    reserve_summary_table.setStyle(TableStyle([
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('TOPPADDING', (0, 0), (-1, -1), 2),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ('SPAN', (0, 0), (1, 0)),
-    ]))
+    reserve_summary_table = Table(reserve_summary_data, colWidths=_TITLED_SUMMARY_COL_WIDTHS)
+    reserve_summary_table.setStyle(_TITLED_SUMMARY_STYLE)
 
     # Net Income summary
     net_income_summary_data = [
-        [Paragraph('<b>Net Income</b>', normal_style), ''],
+        ['Net Income', ''],
         ['Income:', format_currency(income_actual)],
         ['Expenses:', format_currency(expense_actual)],
-        ['Net:', f'{net_prefix}{format_currency(net_income)}']
+        ['Net:', format_signed_currency(net_income)]
     ]
-    net_income_summary_table = Table(net_income_summary_data, colWidths=[1.2*inch, 1.3*inch])
-    net_income_summary_table.setStyle(TableStyle([
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('TOPPADDING', (0, 0), (-1, -1), 2),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-        ('SPAN', (0, 0), (1, 0)),
-    ]))
+    net_income_summary_table = Table(net_income_summary_data, colWidths=_TITLED_SUMMARY_COL_WIDTHS)
+    net_income_summary_table.setStyle(_TITLED_SUMMARY_STYLE)
 
     # Combine the two summary boxes side by side
     combined_summary = Table(
-        [[reserve_summary_table, Spacer(0.5*inch, 0), net_income_summary_table]],
-        colWidths=[2.5*inch, 0.5*inch, 2.5*inch]
+        [[reserve_summary_table, Spacer(_SUMMARY_GAP_WIDTH, 0), net_income_summary_table]],
+        colWidths=_SUMMARY_PAIR_COL_WIDTHS
     )
     elements.append(combined_summary)
     elements.append(Spacer(1, 12))
 
     # Income & Dues - match dashboard layout
-    elements.append(Paragraph("Income & Dues", heading_style))
+    elements.append(Paragraph("Income & Dues", _HEADING_STYLE))
 
     # Income summary totals
-    income = budget_summary['income_summary']
     income_budget = income['annual_budget']
-    income_actual = income['ytd_actual']
     income_remaining = income_budget - income_actual
     # Invert for display: surplus positive (green), deficit negative (red)
     display_income_remaining = -income_remaining
@@ -220,13 +280,8 @@ def generate_dashboard_pdf(as_of_date: Optional[str] = None) -> bytes:
         ['Actual:', format_currency(income_actual)],
         ['Remaining:', format_currency(display_income_remaining)]
     ]
-    summary_table = Table(summary_data, colWidths=[1.5*inch, 1.5*inch])
-    summary_table.setStyle(TableStyle([
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('TOPPADDING', (0, 0), (-1, -1), 2),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-    ]))
+    summary_table = Table(summary_data, colWidths=_SUMMARY_COL_WIDTHS)
+    summary_table.setStyle(_SUMMARY_STYLE)
     elements.append(summary_table)
     elements.append(Spacer(1, 6))
 
@@ -236,27 +291,36 @@ def generate_dashboard_pdf(as_of_date: Optional[str] = None) -> bytes:
     interest_actual = interest_cat['ytd_actual'] if interest_cat else 0
     interest_remaining = interest_budget - interest_actual
 
-    # Calculate totals
-    total_past_due = sum(u['past_due_balance'] for u in dues_data['units'])
-    total_budget = sum(u['annual_budget'] for u in dues_data['units']) + interest_budget
-    total_actual = sum(u['paid_ytd'] for u in dues_data['units']) + interest_actual
-    total_remaining = sum(u['outstanding'] for u in dues_data['units']) + interest_remaining
-
-    # Dues by unit table - match dashboard columns with Past Due
+    # Dues by unit table - match dashboard columns with Past Due.
+    # Totals are accumulated in the same pass that builds the rows.
+    total_past_due = total_budget = total_actual = total_remaining = 0
     dues_table_data = [['Unit', 'Share', 'Past Due', 'Budget', 'Actual', 'Remaining']]
     for unit in dues_data['units']:
-        past_due_display = format_currency(unit['past_due_balance']) if unit['past_due_balance'] > 0 else '-'
+        past_due = unit['past_due_balance']
+        annual_budget = unit['annual_budget']
+        paid_ytd = unit['paid_ytd']
+        outstanding = unit['outstanding']
+        total_past_due += past_due
+        total_budget += annual_budget
+        total_actual += paid_ytd
+        total_remaining += outstanding
+
+        past_due_display = format_currency(past_due) if past_due > 0 else '-'
         # Invert remaining for display
-        display_remaining = -unit['outstanding']
+        display_remaining = -outstanding
         dues_table_data.append([
             unit['unit'],
             f"{unit['ownership_pct']*100:.1f}%",
             past_due_display,
-            format_currency(unit['annual_budget']),
-            format_currency(unit['paid_ytd']),
+            format_currency(annual_budget),
+            format_currency(paid_ytd),
             format_currency(display_remaining)
         ])
 
+    total_budget += interest_budget
+    total_actual += interest_actual
+    total_remaining += interest_remaining
+
     # Interest row
     display_interest_remaining = -interest_remaining
     dues_table_data.append([
@@ -277,30 +341,17 @@ def generate_dashboard_pdf(as_of_date: Optional[str] = None) -> bytes:
     ])
 
     num_rows = len(dues_table_data)
-    dues_table = Table(dues_table_data, colWidths=[0.7*inch, 0.65*inch, 0.85*inch, 1*inch, 1*inch, 1*inch])
-    dues_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),  # Totals row bold
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('LINEABOVE', (0, -1), (-1, -1), 1.5, colors.black),  # Thicker line above totals
-    ]))
+    dues_table = Table(dues_table_data, colWidths=_DUES_COL_WIDTHS)
+    dues_table.setStyle(_TOTALS_TABLE_STYLE)
     elements.append(dues_table)
 
     # Note about past due balances
-    note_style = ParagraphStyle('Note', parent=normal_style, fontSize=8, textColor=colors.grey, fontName='Helvetica-Oblique')
     elements.append(Spacer(1, 4))
-    elements.append(Paragraph("*Past due balances are not included in the current year's operating budget.", note_style))
+    elements.append(Paragraph("*Past due balances are not included in the current year's operating budget.", _NOTE_STYLE))
     elements.append(Spacer(1, 12))
 
     # Operating Expenses - match dashboard layout
-    elements.append(Paragraph("Operating Expenses", heading_style))
-
-    expense = budget_summary['expense_summary']
+    elements.append(Paragraph("Operating Expenses", _HEADING_STYLE))
 
     # Expense summary box
     expense_summary_data = [
@@ -308,25 +359,22 @@ def generate_dashboard_pdf(as_of_date: Optional[str] = None) -> bytes:
         ['Actual:', format_currency(expense['ytd_actual'])],
         ['Remaining:', format_currency(expense['remaining'])]
     ]
-    expense_summary_table = Table(expense_summary_data, colWidths=[1.5*inch, 1.5*inch])
-    expense_summary_table.setStyle(TableStyle([
-        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-        ('TOPPADDING', (0, 0), (-1, -1), 2),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-    ]))
+    expense_summary_table = Table(expense_summary_data, colWidths=_SUMMARY_COL_WIDTHS)
+    expense_summary_table.setStyle(_SUMMARY_STYLE)
     elements.append(expense_summary_table)
     elements.append(Spacer(1, 6))
 
     # Expense category table - match dashboard columns
     expense_data = [['Category', 'Budget', 'Actual', 'Remaining']]
-    for cat in expense['categories']:
-        expense_data.append([
+    expense_data.extend(
+        [
             cat['category'],
             format_currency(cat['annual_budget']),
             format_currency(cat['ytd_actual']),
             format_currency(cat['remaining'])
-        ])
+        ]
+        for cat in expense['categories']
+    )
 
     # Totals row
     expense_data.append([
@@ -336,29 +384,19 @@ def generate_dashboard_pdf(as_of_date: Optional[str] = None) -> bytes:
         format_currency(expense['remaining'])
     ])
 
-    expense_table = Table(expense_data, colWidths=[2.5*inch, 1.15*inch, 1.15*inch, 1.15*inch])
-    expense_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),  # Totals row bold
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('LINEABOVE', (0, -1), (-1, -1), 1.5, colors.black),  # Thicker line above totals
-    ]))
+    expense_table = Table(expense_data, colWidths=_EXPENSE_COL_WIDTHS)
+    expense_table.setStyle(_TOTALS_TABLE_STYLE)
     elements.append(expense_table)
 
     # Note about Reserve Contribution
     elements.append(Spacer(1, 4))
-    elements.append(Paragraph("*Reserve Contribution is funded through internal transfers with no outgoing expense.", note_style))
+    elements.append(Paragraph("*Reserve Contribution is funded through internal transfers with no outgoing expense.", _NOTE_STYLE))
 
     # Footer
     elements.append(Spacer(1, 24))
     elements.append(Paragraph(
         "Denny Way Condo Owners Association",
-        ParagraphStyle('Footer', parent=normal_style, fontSize=8, textColor=colors.grey)
+        _FOOTER_STYLE
     ))
 
     # Build PDF
@@ -370,4 +408,11 @@ def generate_dashboard_pdf(as_of_date: Optional[str] = None) -> bytes:
 
 def format_currency(amount: float) -> str:
     """Format amount as currency string."""
-    return f"${amount:,.2f}"
+    return _CURRENCY_FORMAT(amount)
+
+
+def format_signed_currency(amount: float) -> str:
+    """Format amount as currency string with a leading '+' when not negative."""
+    if amount >= 0:
+        return '+' + _CURRENCY_FORMAT(amount)
+    return _CURRENCY_FORMAT(amount)
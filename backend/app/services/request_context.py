@@ -0,0 +1,25 @@
+"""Per-request values shared across service calls."""
+
+from contextvars import ContextVar
+from datetime import date
+from typing import Optional
+
+_today: ContextVar[Optional[date]] = ContextVar('today', default=None)
+
+
+def today() -> date:
+    """Get today's date, computed once per request.
+
+    Returns:
+        Date cached for the current request
+    """
+    value = _today.get()
+    if value is None:
+        value = date.today()
+        _today.set(value)
+    return value
+
+
+def reset() -> None:
+    """Clear cached values at the start of a new request."""
+    _today.set(None)
@@ -2,6 +2,7 @@
 
 import os
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Tuple
 
 import bcrypt
@@ -41,8 +42,13 @@ def verify_password(password: str, password_hash: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def get_jwt_secret() -> str:
-    """Get JWT secret from environment."""
+    """Get JWT secret from environment.
+
+    Lambda environment variables are fixed for the life of the process, so
+    the lookup is cached after the first call.
+    """
     secret = os.environ.get('JWT_SECRET', '')
     if not secret:
         # Fallback for local development
@@ -59,11 +65,12 @@ def create_token(role: str) -> Tuple[str, datetime]:
     Returns:
         Tuple of (token string, expiration datetime)
     """
-    expires_at = datetime.now(timezone.utc) + timedelta(hours=TOKEN_EXPIRY_HOURS)
+    now = datetime.now(timezone.utc)
+    expires_at = now + timedelta(hours=TOKEN_EXPIRY_HOURS)
     payload = {
         'role': role,
         'exp': expires_at,
-        'iat': datetime.now(timezone.utc)
+        'iat': now
     }
     token = jwt.encode(payload, get_jwt_secret(), algorithm='HS256')
     return token, expires_at
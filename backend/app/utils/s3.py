@@ -2,6 +2,7 @@
 
 import os
 import tempfile
+from functools import lru_cache
 from typing import Optional
 
 import boto3
@@ -18,8 +19,9 @@ def get_s3_client():
     return _s3_client
 
 
+@lru_cache(maxsize=1)
 def get_bucket_name() -> str:
-    """Get the data bucket name from environment."""
+    """Get the data bucket name from environment (read once per process)."""
     return os.environ.get('DATA_BUCKET', 'dwcoa-data-local')
 
 
@@ -104,6 +106,24 @@ def file_exists(key: str) -> bool:
         raise
 
 
+def get_etag(key: str) -> Optional[str]:
+    """Get the ETag of a file in S3.
+
+    Args:
+        key: S3 object key
+
+    Returns:
+        ETag string, or None if the file doesn't exist
+    """
+    try:
+        response = get_s3_client().head_object(Bucket=get_bucket_name(), Key=key)
+        return response['ETag']
+    except ClientError as e:
+        if e.response['Error']['Code'] == '404':
+            return None
+        raise
+
+
 def get_temp_path(filename: str = 'temp') -> str:
     """Get a temporary file path in Lambda's /tmp directory.
 
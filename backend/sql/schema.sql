@@ -94,9 +94,12 @@ CREATE TABLE IF NOT EXISTS app_config (
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(post_date);
 CREATE INDEX IF NOT EXISTS idx_transactions_account ON transactions(account_name);
+CREATE INDEX IF NOT EXISTS idx_transactions_account_latest ON transactions(account_name, post_date DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_transactions_category ON transactions(category_id);
+CREATE INDEX IF NOT EXISTS idx_transactions_category_date ON transactions(category_id, post_date);
 CREATE INDEX IF NOT EXISTS idx_transactions_review ON transactions(needs_review) WHERE needs_review = 1;
 CREATE INDEX IF NOT EXISTS idx_rules_active ON categorize_rules(active, priority DESC);
+CREATE INDEX IF NOT EXISTS idx_rules_pattern_nocase ON categorize_rules(pattern COLLATE NOCASE);
 CREATE INDEX IF NOT EXISTS idx_budgets_year ON budgets(year);
 
 -- View: Transaction summary with category names
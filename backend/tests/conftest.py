@@ -4,6 +4,8 @@ import sys
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+
 # Add backend directory to path
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
@@ -23,5 +25,24 @@ sys.modules['aws_lambda_powertools'] = mock_powertools
 mock_s3 = MagicMock()
 mock_s3.get_bucket_name.return_value = 'test-bucket'
 mock_s3.file_exists.return_value = False
+mock_s3.get_etag.return_value = None
 mock_s3.get_temp_path.return_value = '/tmp/test.db'
 sys.modules['app.utils.s3'] = mock_s3
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Fresh database in a temporary directory, with S3 mocked out."""
+    from app.services import database
+
+    mock_s3.reset_mock(side_effect=True)
+    mock_s3.get_etag.return_value = None
+    mock_s3.get_temp_path.return_value = str(tmp_path / 'dwcoa.db')
+    database.get_connection()
+    mock_s3.upload_file.reset_mock()
+
+    yield database
+
+    database._db_dirty = False
+    database.close_db()
+    mock_s3.get_temp_path.return_value = '/tmp/test.db'
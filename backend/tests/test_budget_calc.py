@@ -0,0 +1,68 @@
+"""Tests for budget calculations."""
+
+from datetime import date
+
+
+def _category_id(db, name):
+    return db.fetch_one("SELECT id FROM categories WHERE name = ?", (name,))['id']
+
+
+def _add_transaction(db, post_date, category_id, debit=None, credit=None):
+    with db.transaction():
+        db.execute(
+            """INSERT INTO transactions
+               (account_number, account_name, post_date, description, debit, credit, balance, category_id)
+               VALUES ('****9242', 'Checking', ?, 'Test', ?, ?, 0, ?)""",
+            (post_date, debit, credit, category_id)
+        )
+
+
+class TestBudgetSummary:
+    """Tests for get_budget_summary()."""
+
+    def test_interest_budget_calculated_from_operating_budget(self, db):
+        """For 2025+, Interest income is budgeted at 0.1% of the operating budget."""
+        from app.services import budget_calc
+
+        summary = budget_calc.get_budget_summary(2025, as_of_date=date(2025, 12, 31))
+
+        interest = next(c for c in summary['income_summary']['categories']
+                        if c['category'] == 'Interest income')
+        operating = budget_calc.get_total_operating_budget(2025)
+        assert operating > 0
+        assert interest['annual_budget'] == round(operating * 0.001, 2)
+        assert summary['income_summary']['annual_budget'] == round(operating, 2)
+
+    def test_interest_budget_stored_before_2025(self, db):
+        """Before 2025, the stored Interest income budget is used as is."""
+        from app.services import budget_calc
+
+        with db.transaction():
+            db.execute("INSERT INTO budgets (year, category_id, annual_amount) VALUES (2024, ?, 50)",
+                       (_category_id(db, 'Interest income'),))
+
+        summary = budget_calc.get_budget_summary(2024, as_of_date=date(2024, 12, 31))
+
+        interest = next(c for c in summary['income_summary']['categories']
+                        if c['category'] == 'Interest income')
+        assert interest['annual_budget'] == 50
+
+    def test_categories_without_budget_or_actual_skipped(self, db):
+        """Only categories with a non-zero budget or YTD actual are listed."""
+        from app.services import budget_calc
+
+        unbudgeted = db.fetch_all_dicts(
+            """SELECT c.id, c.name FROM categories c
+               WHERE c.type = 'Expense' AND c.active = 1
+               AND NOT EXISTS (SELECT 1 FROM budgets b WHERE b.category_id = c.id AND b.year = 2025)"""
+        )
+        assert len(unbudgeted) >= 2
+        spent, idle = unbudgeted[0], unbudgeted[1]
+        _add_transaction(db, '2025-03-01', spent['id'], debit=12.5)
+
+        summary = budget_calc.get_budget_summary(2025, as_of_date=date(2025, 12, 31))
+
+        expenses = {c['category']: c for c in summary['expense_summary']['categories']}
+        assert expenses[spent['name']]['annual_budget'] == 0
+        assert expenses[spent['name']]['ytd_actual'] == 12.5
+        assert idle['name'] not in expenses
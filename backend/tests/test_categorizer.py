@@ -165,6 +165,101 @@ class TestRulesEngine:
         assert result.source == 'rule'
 
 
+    @patch('app.services.categorizer.database')
+    def test_first_rule_wins_regardless_of_position(self, mock_db):
+        """Rule order decides the match, not where the pattern appears."""
+        mock_db.get_categorize_rules.return_value = [
+            {
+                'pattern': 'J ERNAST',
+                'category_id': 8,
+                'category_name': 'Dues 302',
+                'confidence': 100,
+                'priority': 100
+            },
+            {
+                'pattern': 'Deposit',
+                'category_id': 99,
+                'category_name': 'Other',
+                'confidence': 100,
+                'priority': 100
+            }
+        ]
+
+        from app.services.categorizer import categorize_transaction
+
+        result = categorize_transaction('External Deposit J ERNAST', 'Savings')
+
+        assert result.category_id == 8
+
+
+class TestRulesCache:
+    """Tests for prepared-rules caching."""
+
+    @patch('app.services.categorizer.database')
+    def test_rules_reused_until_version_changes(self, mock_db):
+        """Rules should be fetched once per data version."""
+        mock_db.get_data_version.return_value = 1
+        mock_db.get_categorize_rules.return_value = [
+            {
+                'pattern': 'Cintas',
+                'category_id': 5,
+                'category_name': 'Cintas Fire Protection',
+                'confidence': 100,
+                'priority': 100
+            }
+        ]
+
+        from app.services.categorizer import categorize_transaction
+
+        categorize_transaction('CINTAS CORP 123', 'Checking')
+        result = categorize_transaction('cintas corp 456', 'Checking')
+
+        assert result.category_id == 5
+        assert mock_db.get_categorize_rules.call_count == 1
+
+        mock_db.get_data_version.return_value = 2
+        categorize_transaction('CINTAS CORP 789', 'Checking')
+
+        assert mock_db.get_categorize_rules.call_count == 2
+
+    @patch('app.services.categorizer.database')
+    def test_learned_patterns_checked_without_requery(self, mock_db):
+        """Existing patterns should be loaded once until a new rule is learned."""
+        patterns = ['Cintas']
+        mock_db.get_data_version.return_value = 1
+        mock_db.get_rule_patterns.side_effect = lambda: list(patterns)
+        mock_db.create_rule.side_effect = lambda pattern, category_id: patterns.append(pattern)
+        mock_db.get_category_by_id.return_value = {'id': 5, 'name': 'Cintas Fire Protection'}
+
+        from app.services import categorizer
+
+        categorizer._PATTERN_INDEX_CACHE = None
+        categorizer.learn_pattern('CINTAS', 5)
+        categorizer.learn_pattern('cintas', 5)
+        assert mock_db.get_rule_patterns.call_count == 1
+
+        categorizer.learn_pattern('New Vendor', 5)
+        categorizer.learn_pattern('new vendor', 5)
+
+        mock_db.create_rule.assert_called_once_with('New Vendor', 5)
+        assert mock_db.get_rule_patterns.call_count == 2
+
+    @patch('app.services.categorizer.database')
+    def test_rolled_back_pattern_can_be_learned_again(self, mock_db):
+        """A learned rule that was rolled back shouldn't block a later learn."""
+        mock_db.get_data_version.return_value = 1
+        mock_db.get_rule_patterns.return_value = []
+        mock_db.get_category_by_id.return_value = {'id': 5, 'name': 'Cintas Fire Protection'}
+
+        from app.services import categorizer
+
+        categorizer._PATTERN_INDEX_CACHE = None
+        categorizer.learn_pattern('New Vendor', 5)  # create_rule later rolled back
+        categorizer.learn_pattern('New Vendor', 5)
+
+        assert mock_db.create_rule.call_count == 2
+
+
 class TestCategorizationResult:
     """Tests for CategorizationResult model."""
 
@@ -144,3 +144,42 @@ class TestParseCsv:
 
         assert result.duplicate_count == 1
         assert any('Potential duplicate' in w for w in result.warnings)
+
+    @patch('app.services.csv_processor.database')
+    def test_parse_csv_mixed_date_formats(self, mock_db):
+        """Rows in a different date format than earlier rows still parse."""
+        mock_db.get_accounts.return_value = mock_accounts
+
+        from app.services.csv_processor import parse_csv
+
+        csv_content = """Account Number,Post Date,Check,Description,Debit,Credit,Status,Balance
+****7145,1/2/2026,,US date,,100.00,Posted,1000.00
+****7145,2026-01-03,,ISO date,,100.00,Posted,1100.00
+****7145,1/4/2026,,US date again,,100.00,Posted,1200.00
+****7145,2026-01-05,,ISO date again,,100.00,Posted,1300.00"""
+
+        result = parse_csv(csv_content)
+
+        assert len(result.errors) == 0
+        assert [t.post_date for t in result.transactions] == [
+            '2026-01-02', '2026-01-03', '2026-01-04', '2026-01-05'
+        ]
+
+    @patch('app.services.csv_processor.database')
+    def test_parse_csv_non_ascii_digits(self, mock_db):
+        """Dates with non-ASCII digits are parsed exactly as strptime would."""
+        mock_db.get_accounts.return_value = mock_accounts
+
+        from app.services.csv_processor import parse_csv
+
+        # strptime accepts Arabic-Indic digits in the year but not the month
+        csv_content = """Account Number,Post Date,Check,Description,Debit,Credit,Status,Balance
+****7145,1/2/2026,,ASCII date,,100.00,Posted,1000.00
+****7145,1/2/٢٠٢٦,,Arabic-Indic year,,100.00,Posted,1100.00
+****7145,١/٢/٢٠٢٦,,Arabic-Indic month,,100.00,Posted,1200.00"""
+
+        result = parse_csv(csv_content)
+
+        assert [t.post_date for t in result.transactions] == ['2026-01-02', '2026-01-02']
+        assert len(result.errors) == 1
+        assert 'Row 4: Invalid date' in result.errors[0]
@@ -0,0 +1,220 @@
+"""Tests for the database service."""
+
+import shutil
+import sqlite3
+
+import pytest
+from unittest.mock import patch
+
+from app.utils import s3
+
+
+class TestTransaction:
+    """Tests for transaction() commit and rollback handling."""
+
+    def test_rollback_discards_cached_lookups(self, db):
+        """Values cached inside a rolled-back block should not be served."""
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.set_config('current_year', '2030')
+                assert db.get_config('current_year') == '2030'
+                raise RuntimeError('abort')
+
+        assert db.get_config('current_year') == '2026'
+
+    def test_rollback_discards_nested_rule(self, db):
+        """Rules loaded after a nested create that rolls back should not be served."""
+        category_id = db.get_categories()[0]['id']
+        before = db.fetch_one("SELECT COUNT(*) AS count FROM categorize_rules")['count']
+
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.create_rule('Rolled Back Vendor', category_id)
+                assert len(db.get_categorize_rules()) == before + 1
+                raise RuntimeError('abort')
+
+        assert len(db.get_categorize_rules()) == before
+        assert not any(rule['pattern'] == 'Rolled Back Vendor' for rule in db.get_rules())
+
+
+class TestDeferredUpload:
+    """Tests for when committed writes are uploaded to S3."""
+
+    def test_nested_block_joins_outer_commit(self, db):
+        """A nested block's write is only committed with the outer block."""
+        other = sqlite3.connect(db._db_path)
+        try:
+            with db.transaction():
+                with db.transaction():
+                    db.set_config('current_year', '2030')
+                committed = other.execute(
+                    "SELECT value FROM app_config WHERE key = 'current_year'").fetchone()[0]
+                assert committed == '2026'
+                assert not db._db_dirty
+
+            committed = other.execute(
+                "SELECT value FROM app_config WHERE key = 'current_year'").fetchone()[0]
+            assert committed == '2030'
+            assert db._db_dirty
+        finally:
+            other.close()
+
+    def test_noop_block_does_not_upload(self, db):
+        """A block that changes no rows shouldn't mark the database dirty."""
+        with patch.object(db, 'save_db') as save:
+            with db.transaction():
+                db.execute("SELECT COUNT(*) FROM transactions").fetchone()
+                db.execute("UPDATE app_config SET value = value WHERE key = 'missing'")
+            db.flush_db()
+
+        assert not db._db_dirty
+        save.assert_not_called()
+
+    def test_rollback_leaves_database_clean(self, db):
+        """A rolled-back write shouldn't be uploaded or left in the file."""
+        with patch.object(db, 'save_db') as save:
+            with pytest.raises(RuntimeError):
+                with db.transaction():
+                    db.set_config('current_year', '2030')
+                    raise RuntimeError('abort')
+            db.flush_db()
+
+        assert not db._db_dirty
+        save.assert_not_called()
+        assert db.fetch_one("SELECT value FROM app_config WHERE key = 'current_year'")['value'] == '2026'
+
+    def test_flush_uploads_several_writes_once(self, db):
+        """Writes from several blocks are uploaded by one flush, and only once."""
+        with patch.object(db, 'save_db') as save:
+            with db.transaction():
+                db.set_config('current_year', '2030')
+            with db.transaction():
+                db.set_config('last_upload_at', '2026-01-02T03:04:05')
+            db.flush_db()
+            db.flush_db()
+
+        save.assert_called_once()
+        assert not db._db_dirty
+
+    def test_request_writes_uploaded_once(self, db):
+        """Several writes in one request should cost a single upload."""
+        pytest.importorskip('bcrypt')
+        from app import main
+
+        def route(*args):
+            with db.transaction():
+                db.set_config('current_year', '2030')
+            with db.transaction():
+                db.set_config('last_upload_at', '2026-01-02T03:04:05')
+            return main.make_response(200, {})
+
+        with patch.object(main, 'route_request', side_effect=route), \
+                patch.object(db, 'save_db', wraps=db.save_db) as save:
+            response = main.handler({'rawPath': '/api/test'}, None)
+
+        assert response['statusCode'] == 200
+        assert save.call_count == 1
+        assert not db._db_dirty
+
+    def test_writes_before_error_still_uploaded(self, db):
+        """Writes committed before a request fails should still be uploaded once."""
+        pytest.importorskip('bcrypt')
+        from app import main
+
+        def route(*args):
+            with db.transaction():
+                db.set_config('current_year', '2030')
+            raise RuntimeError('handler failed')
+
+        with patch.object(main, 'route_request', side_effect=route), \
+                patch.object(db, 'save_db', wraps=db.save_db) as save:
+            response = main.handler({'rawPath': '/api/test'}, None)
+
+        assert response['statusCode'] == 500
+        assert save.call_count == 1
+        assert not db._db_dirty
+
+
+class TestLocalCopyReuse:
+    """Tests for reusing the /tmp database copy across cold starts."""
+
+    @pytest.fixture
+    def remote(self, db, tmp_path):
+        """Serve a snapshot of the current database as the remote dwcoa.db.
+
+        The local copy then gets a different current_year, so tests can tell
+        which file get_connection() opened.
+        """
+        remote_path = str(tmp_path / 'remote.db')
+        with db.transaction():
+            db.set_config('current_year', '2031')
+        snapshot = sqlite3.connect(remote_path)
+        db.get_connection().backup(snapshot)
+        snapshot.close()
+        with db.transaction():
+            db.set_config('current_year', '2032')
+
+        local_path = db._db_path
+        db._db_dirty = False
+        db.close_db()
+        s3.download_file.side_effect = lambda key, path: shutil.copy(remote_path, path)
+        return local_path
+
+    def _open(self, db, remote_etag):
+        s3.get_etag.side_effect = lambda key: remote_etag if key == db.DB_KEY else None
+        s3.download_file.reset_mock()
+        db.get_connection()
+        return db.get_config('current_year')
+
+    def test_matching_etag_reuses_local_copy(self, db, remote):
+        """An unchanged ETag should open /tmp/dwcoa.db without downloading."""
+        db._write_etag(remote, 'v1')
+
+        assert self._open(db, 'v1') == '2032'
+        s3.download_file.assert_not_called()
+
+    def test_changed_etag_downloads_again(self, db, remote):
+        """A new ETag in S3 should replace the local copy and its sidecar."""
+        db._write_etag(remote, 'v1')
+
+        assert self._open(db, 'v2') == '2031'
+        s3.download_file.assert_called_once()
+        assert db._read_etag(remote) == 'v2'
+
+    def test_leftover_wal_downloads_again(self, db, remote):
+        """A leftover WAL means local-only writes, so the copy is replaced."""
+        db._write_etag(remote, 'v1')
+        with open(remote + '-wal', 'wb') as f:
+            f.write(b'stale frames')
+
+        assert self._open(db, 'v1') == '2031'
+        s3.download_file.assert_called_once()
+        assert db.fetch_one("PRAGMA integrity_check")[0] == 'ok'
+
+
+class TestConfig:
+    """Tests for cached config lookups."""
+
+    def test_config_values_reused_until_write(self, db):
+        """Config should be queried once per data version, and writes seen at once."""
+        with patch.object(db, 'fetch_all_tuples', wraps=db.fetch_all_tuples) as fetch:
+            assert db.get_config('current_year') == '2026'
+            assert db.get_config('last_upload_at') == ''
+            assert db.get_config('missing') is None
+            assert fetch.call_count == 1
+
+            with db.transaction():
+                db.set_config('last_upload_at', '2026-01-02T03:04:05')
+                assert db.get_config('last_upload_at') == '2026-01-02T03:04:05'
+
+        assert db.get_config('last_upload_at') == '2026-01-02T03:04:05'
+
+    def test_rolled_back_config_not_served(self, db):
+        """A rolled-back last_upload_at should not be returned afterwards."""
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.set_config('last_upload_at', '2026-01-02T03:04:05')
+                assert db.get_config('last_upload_at') == '2026-01-02T03:04:05'
+                raise RuntimeError('abort')
+
+        assert db.get_config('last_upload_at') == ''
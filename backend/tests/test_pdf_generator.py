@@ -0,0 +1,62 @@
+"""Tests for PDF report generation."""
+
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip('reportlab')
+
+
+def _add_transaction(db):
+    with db.transaction():
+        db.execute(
+            """INSERT INTO transactions
+               (account_number, account_name, post_date, description, credit, balance)
+               VALUES ('****7145', 'Savings', '2026-01-02', 'Deposit', 100, 1100)"""
+        )
+
+
+class TestPdfCache:
+    """Tests for reusing rendered dashboard PDFs."""
+
+    @pytest.fixture
+    def pdf_generator(self, db):
+        from app.services import pdf_generator
+
+        pdf_generator._PDF_CACHE.clear()
+        yield pdf_generator
+        pdf_generator._PDF_CACHE.clear()
+
+    def test_repeat_render_is_a_hit(self, pdf_generator):
+        """The same date with unchanged data should not render again."""
+        with patch.object(pdf_generator, '_build_dashboard_pdf',
+                          wraps=pdf_generator._build_dashboard_pdf) as build:
+            first = pdf_generator.generate_dashboard_pdf('2026-06-30')
+            second = pdf_generator.generate_dashboard_pdf('2026-06-30')
+
+        assert first.startswith(b'%PDF')
+        assert second == first
+        assert build.call_count == 1
+
+    def test_write_invalidates_cached_pdf(self, pdf_generator, db):
+        """A committed write should make the next render a miss."""
+        with patch.object(pdf_generator, '_build_dashboard_pdf',
+                          wraps=pdf_generator._build_dashboard_pdf) as build:
+            pdf_generator.generate_dashboard_pdf('2026-06-30')
+            _add_transaction(db)
+            pdf_generator.generate_dashboard_pdf('2026-06-30')
+
+        assert build.call_count == 2
+
+    def test_rollback_invalidates_cached_pdf(self, pdf_generator, db):
+        """A PDF rendered inside a block that rolls back should not be reused."""
+        with patch.object(pdf_generator, '_build_dashboard_pdf',
+                          wraps=pdf_generator._build_dashboard_pdf) as build:
+            with pytest.raises(RuntimeError):
+                with db.transaction():
+                    _add_transaction(db)
+                    pdf_generator.generate_dashboard_pdf('2026-06-30')
+                    raise RuntimeError('abort')
+            pdf_generator.generate_dashboard_pdf('2026-06-30')
+
+        assert build.call_count == 2
@@ -0,0 +1,46 @@
+"""Tests for transaction routes."""
+
+import json
+
+HEADER = 'Account Number,Post Date,Check,Description,Debit,Credit,Status,Balance\n'
+
+
+class TestUpload:
+    """Tests for CSV upload duplicate handling."""
+
+    def test_overlapping_reupload_skips_existing_rows(self, db):
+        """Rows already imported are skipped; only the new rows are inserted."""
+        from app.routes.transactions import handle_upload
+
+        first = HEADER + (
+            '****7145,1/2/2026,,Deposit A,,100.00,Posted,1100.00\n'
+            '****7145,1/3/2026,,Deposit B,,50.00,Posted,1150.00\n'
+            '****9242,1/3/2026,101,Check payment,25.00,,Posted,475.00\n'
+        )
+        second = HEADER + (
+            '****7145,1/3/2026,,Deposit B,,50.00,Posted,1150.00\n'
+            '****9242,1/3/2026,101,Check payment,25.00,,Posted,475.00\n'
+            '****9242,1/3/2026,102,Check payment,25.00,,Posted,450.00\n'
+            '****7145,1/4/2026,,Deposit C,,75.00,Posted,1225.00\n'
+        )
+
+        response = handle_upload({'file': first})
+        assert response['statusCode'] == 200
+        assert json.loads(response['body'])['stats']['added'] == 3
+
+        response = handle_upload({'file': second})
+        stats = json.loads(response['body'])['stats']
+        assert response['statusCode'] == 200
+        assert stats['added'] == 2
+        assert stats['skipped'] == 2
+
+        rows = db.fetch_all_tuples(
+            "SELECT post_date, account_number, description, balance FROM transactions ORDER BY id"
+        )
+        assert rows == [
+            ('2026-01-02', '****7145', 'Deposit A', 1100.0),
+            ('2026-01-03', '****7145', 'Deposit B', 1150.0),
+            ('2026-01-03', '****9242', 'Check payment', 475.0),
+            ('2026-01-03', '****9242', 'Check payment', 450.0),
+            ('2026-01-04', '****7145', 'Deposit C', 1225.0),
+        ]